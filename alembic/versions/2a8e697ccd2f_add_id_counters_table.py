@@ -0,0 +1,35 @@
+"""Add id counters table
+
+Revision ID: 2a8e697ccd2f
+Revises: caef0a41606e
+Create Date: 2026-10-15 13:20:48.105732
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2a8e697ccd2f"
+down_revision: str | Sequence[str] | None = "caef0a41606e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Counters are seeded lazily from existing IDs on first allocation, so no backfill is needed
+    op.create_table(
+        "id_counters",
+        sa.Column("name", sa.String(length=40), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("id_counters")
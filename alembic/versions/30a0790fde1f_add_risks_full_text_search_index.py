@@ -0,0 +1,34 @@
+"""Add risks full-text search index
+
+Revision ID: 30a0790fde1f
+Revises: dbc7c676593e
+Create Date: 2026-10-15 14:02:35.918276
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from app.models.risk import RISKS_FTS_DDL
+
+# revision identifiers, used by Alembic.
+revision: str = "30a0790fde1f"
+down_revision: str | Sequence[str] | None = "dbc7c676593e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in RISKS_FTS_DDL:
+        op.execute(statement)
+    # Index the rows that already exist
+    op.execute("INSERT INTO risks_fts(risks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS risks_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS risks_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS risks_fts_ai")
+    op.execute("DROP TABLE IF EXISTS risks_fts")
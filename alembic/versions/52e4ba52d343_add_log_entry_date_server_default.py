@@ -0,0 +1,31 @@
+"""Add log entry date server default
+
+Revision ID: 52e4ba52d343
+Revises: 30a0790fde1f
+Create Date: 2026-10-15 14:41:08.227154
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "52e4ba52d343"
+down_revision: str | Sequence[str] | None = "30a0790fde1f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("risk_log_entries") as batch_op:
+        batch_op.alter_column("entry_date", existing_type=sa.Date(), server_default=sa.func.current_date())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("risk_log_entries") as batch_op:
+        batch_op.alter_column("entry_date", existing_type=sa.Date(), server_default=None)
@@ -0,0 +1,39 @@
+"""Extend net exposure score index with financial impact
+
+Revision ID: 68d40d14fe52
+Revises: 7349c3a04ef3
+Create Date: 2026-10-15 11:26:03.571920
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "68d40d14fe52"
+down_revision: str | Sequence[str] | None = "7349c3a04ef3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_risks_status_net_exposure_score", table_name="risks")
+    op.create_index(
+        "ix_risks_status_net_exposure_score",
+        "risks",
+        ["risk_status", "business_disruption_net_exposure_score", "financial_impact_high"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risks_status_net_exposure_score", table_name="risks")
+    op.create_index(
+        "ix_risks_status_net_exposure_score",
+        "risks",
+        ["risk_status", "business_disruption_net_exposure_score"],
+        unique=False,
+    )
@@ -0,0 +1,48 @@
+"""Add generated net severity column
+
+Revision ID: 7349c3a04ef3
+Revises: ee1dd93e6e93
+Create Date: 2026-10-15 11:02:26.918344
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7349c3a04ef3"
+down_revision: str | Sequence[str] | None = "ee1dd93e6e93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated from business_disruption_net_exposure, so existing rows need no backfill
+    op.add_column(
+        "risks",
+        sa.Column(
+            "business_disruption_net_severity",
+            sa.String(length=10),
+            sa.Computed(
+                "substr(business_disruption_net_exposure, 1, instr(business_disruption_net_exposure, ' (') - 1)",
+                persisted=False,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_risks_status_net_severity",
+        "risks",
+        ["risk_status", "business_disruption_net_severity"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risks_status_net_severity", table_name="risks")
+    op.drop_column("risks", "business_disruption_net_severity")
@@ -0,0 +1,41 @@
+"""Add generated IBS affected count column
+
+Revision ID: b8ce3400f46f
+Revises: 68d40d14fe52
+Create Date: 2026-10-15 11:58:40.273615
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8ce3400f46f"
+down_revision: str | Sequence[str] | None = "68d40d14fe52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "risks",
+        sa.Column(
+            "ibs_affected_count",
+            sa.Integer(),
+            sa.Computed(
+                "CASE WHEN trim(coalesce(ibs_affected, '')) = '' THEN 0 "
+                "ELSE length(ibs_affected) - length(replace(replace(ibs_affected, ';', ''), ',', '')) + 1 END",
+                persisted=False,
+            ),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("risks", "ibs_affected_count")
@@ -0,0 +1,34 @@
+"""Add risk listing default sort index
+
+Revision ID: caef0a41606e
+Revises: b8ce3400f46f
+Create Date: 2026-10-15 12:41:09.384257
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "caef0a41606e"
+down_revision: str | Sequence[str] | None = "b8ce3400f46f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_risks_default_sort",
+        "risks",
+        [sa.text("business_disruption_net_exposure DESC"), "risk_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risks_default_sort", table_name="risks")
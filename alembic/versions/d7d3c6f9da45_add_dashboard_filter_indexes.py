@@ -0,0 +1,45 @@
+"""Add dashboard filter indexes on risks
+
+Revision ID: d7d3c6f9da45
+Revises: fb12645a9f51
+Create Date: 2026-10-15 09:12:41.118204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7d3c6f9da45"
+down_revision: str | Sequence[str] | None = "fb12645a9f51"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_risks_status_net_exposure",
+        "risks",
+        ["risk_status", "business_disruption_net_exposure"],
+        unique=False,
+    )
+    op.create_index("ix_risks_status_domain", "risks", ["risk_status", "technology_domain"], unique=False)
+    op.create_index(
+        "ix_risks_status_response_strategy",
+        "risks",
+        ["risk_status", "risk_response_strategy"],
+        unique=False,
+    )
+    op.create_index("ix_risks_next_review_date", "risks", ["next_review_date"], unique=False)
+    op.create_index("ix_risks_last_reviewed", "risks", ["last_reviewed"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risks_last_reviewed", table_name="risks")
+    op.drop_index("ix_risks_next_review_date", table_name="risks")
+    op.drop_index("ix_risks_status_response_strategy", table_name="risks")
+    op.drop_index("ix_risks_status_domain", table_name="risks")
+    op.drop_index("ix_risks_status_net_exposure", table_name="risks")
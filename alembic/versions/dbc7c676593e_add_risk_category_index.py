@@ -0,0 +1,27 @@
+"""Add risk category index
+
+Revision ID: dbc7c676593e
+Revises: 2a8e697ccd2f
+Create Date: 2026-10-15 13:39:12.660481
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "dbc7c676593e"
+down_revision: str | Sequence[str] | None = "2a8e697ccd2f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_risks_category", "risks", ["risk_category"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risks_category", table_name="risks")
@@ -0,0 +1,49 @@
+"""Add generated net exposure score column
+
+Revision ID: ee1dd93e6e93
+Revises: fb180be66f53
+Create Date: 2026-10-15 10:31:52.640187
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ee1dd93e6e93"
+down_revision: str | Sequence[str] | None = "fb180be66f53"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite can only add VIRTUAL generated columns in place; the index stores the computed value
+    op.add_column(
+        "risks",
+        sa.Column(
+            "business_disruption_net_exposure_score",
+            sa.Integer(),
+            sa.Computed(
+                "CAST(substr(business_disruption_net_exposure, instr(business_disruption_net_exposure, '(') + 1) "
+                "AS INTEGER)",
+                persisted=False,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_risks_status_net_exposure_score",
+        "risks",
+        ["risk_status", "business_disruption_net_exposure_score"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risks_status_net_exposure_score", table_name="risks")
+    op.drop_column("risks", "business_disruption_net_exposure_score")
@@ -0,0 +1,32 @@
+"""Add risk log entry type/date index
+
+Revision ID: fb180be66f53
+Revises: d7d3c6f9da45
+Create Date: 2026-10-15 10:04:17.502913
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fb180be66f53"
+down_revision: str | Sequence[str] | None = "d7d3c6f9da45"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_risk_log_entries_type_date",
+        "risk_log_entries",
+        ["entry_type", "entry_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_risk_log_entries_type_date", table_name="risk_log_entries")
@@ -27,9 +27,13 @@ def get_dropdown_categories(db: Session = Depends(get_db)) -> list[str]:
 
 @router.get("/values/by-category", response_model=dict[str, list[DropdownValue]])
 def get_dropdown_values_by_category(
-    categories: list[str] | None = Query(None, description="Specific categories to retrieve"),
+    categories: list[str] | None = Query(
+        None, description="Specific categories to retrieve (repeated or comma-separated, e.g. ?categories=a,b)"
+    ),
     db: Session = Depends(get_db),
 ) -> dict[str, list[DropdownValue]]:
-    """Get dropdown values grouped by category."""
+    """Get dropdown values grouped by category, serving several form dropdowns in one request."""
+    if categories:
+        categories = [category for entry in categories for category in entry.split(",") if category]
     service = DropdownService(db)
     return service.get_dropdown_values_by_categories(categories=categories)
@@ -50,8 +50,8 @@ def get_risks(
 
     service = RiskService(db)
 
-    # Get risks and total count
-    risks = service.get_risks(
+    # Get risks and total count in one round trip
+    risks, total = service.get_risks_page(
         skip=skip,
         limit=limit,
         category=category,
@@ -61,12 +61,6 @@ def get_risks(
         sort_order=sort_order,
     )
 
-    total = service.get_risks_count(
-        category=category,
-        status=status,
-        search=search,
-    )
-
     # Calculate pagination metadata
     page = (skip // limit) + 1
     pages = (total + limit - 1) // limit  # Ceiling division
@@ -82,8 +76,8 @@ def get_risks(
         has_next=has_next,
     )
 
-    return PaginatedRiskResponse(
-        items=risks,  # type: ignore[arg-type]
+    return PaginatedRiskResponse.model_construct(
+        items=[Risk.from_orm_fast(risk) for risk in risks],
         pagination=pagination,
     )
 
@@ -103,6 +97,23 @@ def create_risk(risk_data: RiskCreate, db: Session = Depends(get_db)) -> Risk:
     return service.create_risk(risk_data)  # type: ignore[return-value,no-any-return]
 
 
+@router.post("/bulk", response_model=list[Risk])
+def bulk_create_risks(risks_data: list[RiskCreate], db: Session = Depends(get_db)) -> list[Risk]:
+    """Create many risks in one request and one transaction.
+
+    The whole batch is rejected if any risk ID is repeated or already exists.
+    """
+    risk_ids = [risk.risk_id for risk in risks_data if risk.risk_id]
+    if len(set(risk_ids)) != len(risk_ids):
+        raise HTTPException(status_code=400, detail="Duplicate risk IDs in request")
+
+    service = RiskService(db)
+    existing = service.get_existing_risk_ids(risk_ids)
+    if existing:
+        raise HTTPException(status_code=400, detail=f"Risks already exist: {', '.join(sorted(existing))}")
+    return service.bulk_create_risks(risks_data)  # type: ignore[no-any-return]
+
+
 @router.put("/{risk_id}", response_model=Risk)
 def update_risk(risk_id: str, risk_data: RiskUpdate, db: Session = Depends(get_db)) -> Risk:
     service = RiskService(db)
@@ -2,14 +2,19 @@ from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
+    event,
+    func,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -17,8 +22,74 @@ from sqlalchemy.orm import relationship
 Base: Any = declarative_base()
 
 
+# Impact × Likelihood matrix mapping
+_IMPACT_VALUES = {"Low": 1, "Moderate": 2, "Major": 3, "Catastrophic": 4}
+_LIKELIHOOD_VALUES = {"Remote": 1, "Unlikely": 2, "Possible": 3, "Probable": 4}
+
+# Matrix calculation: values 1-16
+_EXPOSURE_MATRIX = {
+    (1, 1): 1,  # Low-Remote
+    (1, 2): 2,  # Low-Unlikely
+    (1, 3): 3,  # Low-Possible
+    (1, 4): 5,  # Low-Probable
+    (2, 1): 4,  # Moderate-Remote
+    (2, 2): 6,  # Moderate-Unlikely
+    (2, 3): 7,  # Moderate-Possible
+    (2, 4): 9,  # Moderate-Probable
+    (3, 1): 8,  # Major-Remote
+    (3, 2): 10,  # Major-Unlikely
+    (3, 3): 11,  # Major-Possible
+    (3, 4): 13,  # Major-Probable
+    (4, 1): 12,  # Catastrophic-Remote
+    (4, 2): 14,  # Catastrophic-Unlikely
+    (4, 3): 15,  # Catastrophic-Possible
+    (4, 4): 16,  # Catastrophic-Probable
+}
+
+
+def net_exposure_for(impact_rating: str, likelihood_rating: str) -> str:
+    """Net exposure label, e.g. "Critical (16)", for an impact and likelihood rating pair."""
+    impact_val = _IMPACT_VALUES.get(impact_rating, 1)
+    likelihood_val = _LIKELIHOOD_VALUES.get(likelihood_rating, 1)
+
+    exposure_number = _EXPOSURE_MATRIX.get((impact_val, likelihood_val), 1)
+
+    # Map to exposure categories
+    if exposure_number <= 4:
+        category = "Low"
+    elif exposure_number <= 8:
+        category = "Medium"
+    elif exposure_number <= 12:
+        category = "High"
+    else:
+        category = "Critical"
+
+    return f"{category} ({exposure_number})"
+
+
 class Risk(Base):
     __tablename__ = "risks"
+    # Fetch server defaults and generated columns with RETURNING on INSERT rather than a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Dashboard filter predicates (active-risk status combined with grouping/bucketing columns)
+        Index("ix_risks_status_net_exposure", "risk_status", "business_disruption_net_exposure"),
+        Index("ix_risks_status_net_severity", "risk_status", "business_disruption_net_severity"),
+        # Also covers the top priority risks ORDER BY score, financial_impact_high (scanned backwards for DESC)
+        Index(
+            "ix_risks_status_net_exposure_score",
+            "risk_status",
+            "business_disruption_net_exposure_score",
+            "financial_impact_high",
+        ),
+        Index("ix_risks_status_domain", "risk_status", "technology_domain"),
+        Index("ix_risks_status_response_strategy", "risk_status", "risk_response_strategy"),
+        # Risk listing category filter (status filters are served by the risk_status-leading indexes above)
+        Index("ix_risks_category", "risk_category"),
+        # Review activity metrics
+        Index("ix_risks_next_review_date", "next_review_date"),
+        Index("ix_risks_last_reviewed", "last_reviewed"),
+    )
 
     # Core Risk Identification Fields
     risk_id = Column(String(12), primary_key=True, index=True)
@@ -50,11 +121,36 @@ class Risk(Base):
 
     # Business Disruption Assessment Fields - New model
     ibs_affected = Column(String(200))  # Replaced boolean ibs_impact
+    # Number of services named in ibs_affected (comma/semicolon separated), derived by the database
+    ibs_affected_count = Column(
+        Integer,
+        Computed(
+            "CASE WHEN trim(coalesce(ibs_affected, '')) = '' THEN 0 "
+            "ELSE length(ibs_affected) - length(replace(replace(ibs_affected, ';', ''), ',', '')) + 1 END",
+            persisted=False,
+        ),
+    )
     business_disruption_impact_rating = Column(String(20), nullable=False)  # Low/Moderate/Major/Catastrophic
     business_disruption_impact_description = Column(String(400), nullable=False)
     business_disruption_likelihood_rating = Column(String(20), nullable=False)  # Remote/Unlikely/Possible/Probable
     business_disruption_likelihood_description = Column(String(400), nullable=False)
     business_disruption_net_exposure = Column(String(30), nullable=False)  # Auto-calculated
+    # Severity label and numeric matrix score from "<Level> (<score>)", derived by the database so they
+    # can be indexed, filtered by equality and sorted
+    business_disruption_net_severity = Column(
+        String(10),
+        Computed(
+            "substr(business_disruption_net_exposure, 1, instr(business_disruption_net_exposure, ' (') - 1)",
+            persisted=False,
+        ),
+    )
+    business_disruption_net_exposure_score = Column(
+        Integer,
+        Computed(
+            "CAST(substr(business_disruption_net_exposure, instr(business_disruption_net_exposure, '(') + 1) AS INTEGER)",
+            persisted=False,
+        ),
+    )
 
     # Financial Impact Fields - Keep existing with addition
     financial_impact_low = Column(Numeric(12, 2))
@@ -84,58 +180,25 @@ class Risk(Base):
 
     def calculate_net_exposure(self) -> None:
         """Calculate business disruption net exposure based on impact and likelihood matrix."""
-        # Impact × Likelihood matrix mapping
-        impact_values = {"Low": 1, "Moderate": 2, "Major": 3, "Catastrophic": 4}
-
-        likelihood_values = {"Remote": 1, "Unlikely": 2, "Possible": 3, "Probable": 4}
-
-        # Matrix calculation: values 1-16
-        matrix = {
-            (1, 1): 1,  # Low-Remote
-            (1, 2): 2,  # Low-Unlikely
-            (1, 3): 3,  # Low-Possible
-            (1, 4): 5,  # Low-Probable
-            (2, 1): 4,  # Moderate-Remote
-            (2, 2): 6,  # Moderate-Unlikely
-            (2, 3): 7,  # Moderate-Possible
-            (2, 4): 9,  # Moderate-Probable
-            (3, 1): 8,  # Major-Remote
-            (3, 2): 10,  # Major-Unlikely
-            (3, 3): 11,  # Major-Possible
-            (3, 4): 13,  # Major-Probable
-            (4, 1): 12,  # Catastrophic-Remote
-            (4, 2): 14,  # Catastrophic-Unlikely
-            (4, 3): 15,  # Catastrophic-Possible
-            (4, 4): 16,  # Catastrophic-Probable
-        }
-
-        impact_val = impact_values.get(str(self.business_disruption_impact_rating), 1)
-        likelihood_val = likelihood_values.get(str(self.business_disruption_likelihood_rating), 1)
-
-        exposure_number = matrix.get((impact_val, likelihood_val), 1)
-
-        # Map to exposure categories
-        if exposure_number <= 4:
-            category = "Low"
-        elif exposure_number <= 8:
-            category = "Medium"
-        elif exposure_number <= 12:
-            category = "High"
-        else:
-            category = "Critical"
-
-        self.business_disruption_net_exposure = f"{category} ({exposure_number})"  # type: ignore[assignment]
+        self.business_disruption_net_exposure = net_exposure_for(  # type: ignore[assignment]
+            str(self.business_disruption_impact_rating), str(self.business_disruption_likelihood_rating)
+        )
 
 
 class RiskLogEntry(Base):
     __tablename__ = "risk_log_entries"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Dashboard "recent rating changes" metric (entry type equality, then entry date range)
+        Index("ix_risk_log_entries_type_date", "entry_type", "entry_date"),
+    )
 
     # Primary identification
     log_entry_id = Column(String(15), primary_key=True, index=True)
     risk_id = Column(String(12), ForeignKey("risks.risk_id"), nullable=False, index=True)
 
     # Entry metadata
-    entry_date = Column(Date, nullable=False)
+    entry_date = Column(Date, nullable=False, server_default=func.current_date())  # Stamped by the database
     entry_type = Column(String(50), nullable=False)  # e.g., "Risk Assessment Update", "Mitigation Completed", "Review"
     entry_summary = Column(String(500), nullable=False)
 
@@ -198,3 +261,40 @@ class DropdownValue(Base):
     value = Column(String(100), nullable=False)
     display_order = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
+
+
+class IdCounter(Base):
+    """Last allocated sequence number per ID scope (e.g. risk IDs per year, log entries per risk)."""
+
+    __tablename__ = "id_counters"
+
+    name = Column(String(40), primary_key=True)
+    value = Column(Integer, nullable=False)
+
+
+# Default risk listing order (net exposure DESC, risk_id ASC); the mixed directions need an
+# expression index, so it is declared once the columns exist
+Index("ix_risks_default_sort", Risk.business_disruption_net_exposure.desc(), Risk.risk_id)
+
+# Full-text index for the risk listing search (SQLite FTS5). The trigram tokenizer indexes every
+# three-character substring, so substring searches on title/description are index lookups instead
+# of a case-folding scan. Triggers keep the external-content index in step with the risks table.
+RISKS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS risks_fts USING fts5("
+    "risk_title, risk_description, content='risks', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS risks_fts_ai AFTER INSERT ON risks BEGIN "
+    "INSERT INTO risks_fts(rowid, risk_title, risk_description) "
+    "VALUES (new.rowid, new.risk_title, new.risk_description); END",
+    "CREATE TRIGGER IF NOT EXISTS risks_fts_ad AFTER DELETE ON risks BEGIN "
+    "INSERT INTO risks_fts(risks_fts, rowid, risk_title, risk_description) "
+    "VALUES ('delete', old.rowid, old.risk_title, old.risk_description); END",
+    "CREATE TRIGGER IF NOT EXISTS risks_fts_au AFTER UPDATE OF risk_title, risk_description ON risks BEGIN "
+    "INSERT INTO risks_fts(risks_fts, rowid, risk_title, risk_description) "
+    "VALUES ('delete', old.rowid, old.risk_title, old.risk_description); "
+    "INSERT INTO risks_fts(rowid, risk_title, risk_description) "
+    "VALUES (new.rowid, new.risk_title, new.risk_description); END",
+)
+
+for _statement in RISKS_FTS_DDL:
+    event.listen(Risk.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(Risk.__table__, "after_drop", DDL("DROP TABLE IF EXISTS risks_fts").execute_if(dialect="sqlite"))
@@ -184,6 +184,8 @@ def generate_llm_code(
 # CODE EXTRACTION
 # ==========================
 
+_EXECUTE_BLOCK_RE = re.compile(r"<execute_python>(.*?)</execute_python>", re.DOTALL | re.IGNORECASE)
+
 
 def _extract_execute_block(text: str) -> str:
     """
@@ -192,7 +194,7 @@ def _extract_execute_block(text: str) -> str:
     """
     if not text:
         raise RuntimeError("Empty content passed to code executor.")
-    m = re.search(r"<execute_python>(.*?)</execute_python>", text, re.DOTALL | re.IGNORECASE)
+    m = _EXECUTE_BLOCK_RE.search(text)
     return m.group(1).strip() if m else text.strip()
 
 
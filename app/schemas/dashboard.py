@@ -1,9 +1,15 @@
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Dashboard payloads are cached and shared across requests, so instances are immutable.
+# Schemas are response-only and build their core schema lazily on first use.
+_RESPONSE_CONFIG = ConfigDict(defer_build=True, frozen=True)
 
 
 class RiskSeverityDistribution(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     critical: int  # 16-25
     high: int  # 12-15
     medium: int  # 6-11
@@ -11,12 +17,16 @@ class RiskSeverityDistribution(BaseModel):
 
 
 class TechnologyDomainRisk(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     domain: str
     risk_count: int
     average_risk_rating: float
 
 
 class ControlPosture(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     preventative_adequate_percentage: float
     detective_adequate_percentage: float
     corrective_adequate_percentage: float
@@ -24,6 +34,8 @@ class ControlPosture(BaseModel):
 
 
 class TopRisk(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     risk_id: str
     risk_title: str
     business_disruption_net_exposure: str
@@ -33,6 +45,8 @@ class TopRisk(BaseModel):
 
 
 class RiskResponseBreakdown(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     mitigate: int
     accept: int
     transfer: int
@@ -40,12 +54,16 @@ class RiskResponseBreakdown(BaseModel):
 
 
 class RiskManagementActivity(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     risks_reviewed_this_month: int
     overdue_reviews: int
     recent_risk_rating_changes: int
 
 
 class BusinessServiceExposure(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     risks_affecting_ibs: int
     total_ibs_affected: int
     percentage_risks_with_ibs_impact: float
@@ -53,6 +71,8 @@ class BusinessServiceExposure(BaseModel):
 
 
 class DashboardData(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     # Overall Risk Exposure
     total_active_risks: int
     critical_high_risk_count: int
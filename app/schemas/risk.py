@@ -1,7 +1,8 @@
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RiskBase(BaseModel):
@@ -70,8 +71,13 @@ class Risk(RiskBase):
     business_disruption_impact_description: str = Field(..., max_length=800)
     business_disruption_likelihood_description: str = Field(..., max_length=800)
 
-    class Config:
-        from_attributes = True
+    # Response-only model: build the core schema lazily on first use
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Self:
+        """Build from a trusted ORM row without re-running validation (data was validated on write)."""
+        return cls.model_construct(**{field: getattr(obj, field) for field in cls.model_fields})
 
 
 class RiskLogEntryBase(BaseModel):
@@ -143,8 +149,7 @@ class RiskLogEntryResponse(RiskLogEntryBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 # Legacy aliases for backward compatibility during transition
@@ -156,6 +161,8 @@ RiskUpdateResponse = RiskLogEntryResponse
 class PaginationMetadata(BaseModel):
     """Pagination metadata for list responses."""
 
+    model_config = ConfigDict(frozen=True)
+
     total: int = Field(..., description="Total number of items")
     page: int = Field(..., description="Current page number (1-based)")
     per_page: int = Field(..., description="Number of items per page")
@@ -167,6 +174,8 @@ class PaginationMetadata(BaseModel):
 class PaginatedRiskResponse(BaseModel):
     """Paginated response for risk lists."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     items: list[Risk] = Field(..., description="List of risks")
     pagination: PaginationMetadata = Field(..., description="Pagination metadata")
 
@@ -181,5 +190,4 @@ class DropdownValueBase(BaseModel):
 class DropdownValue(DropdownValueBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
@@ -1,8 +1,11 @@
 """Cloud Storage service for managing SQLite database sync."""
 
 import logging
+import os
+import threading
 from pathlib import Path
 
+from google.api_core.exceptions import DeadlineExceeded, NotFound, NotModified
 from google.cloud import storage
 
 from app.core.config import settings
@@ -15,6 +18,8 @@ class CloudStorageService:
 
     def __init__(self) -> None:
         self.client: storage.Client | None = None
+        self._bucket: storage.Bucket | None = None
+        self._client_lock = threading.Lock()
         self.bucket_name = settings.GCP_BUCKET_NAME
         self.project_id = settings.GCP_PROJECT_ID
         self.db_filename = "risk_register.db"
@@ -23,11 +28,15 @@ class CloudStorageService:
     def _get_client(self) -> storage.Client:
         """Get or create Google Cloud Storage client."""
         if self.client is None:
-            if self.project_id:
-                self.client = storage.Client(project=self.project_id)
-            else:
-                # For local development or when running outside GCP
-                self.client = storage.Client()
+            # Client construction performs credential discovery, so concurrent callers
+            # (e.g. write requests syncing in parallel) share a single in-flight construction
+            with self._client_lock:
+                if self.client is None:
+                    if self.project_id:
+                        self.client = storage.Client(project=self.project_id)
+                    else:
+                        # For local development or when running outside GCP
+                        self.client = storage.Client()
         return self.client
 
     def _get_bucket(self) -> storage.Bucket | None:
@@ -36,14 +45,56 @@ class CloudStorageService:
             logger.warning("GCP_BUCKET_NAME not configured, skipping Cloud Storage operations")
             return None
 
+        # Reuse the Bucket handle unless the configured bucket name has changed
+        if self._bucket is not None and self._bucket.name == self.bucket_name:
+            return self._bucket
+
         try:
             client = self._get_client()
-            return client.bucket(self.bucket_name)
+            self._bucket = client.bucket(self.bucket_name)
+            return self._bucket
         except Exception as e:
             logger.error(f"Failed to get bucket {self.bucket_name}: {e}")
             return None
 
-    def download_database(self) -> bool:
+    def _get_generation_path(self) -> Path:
+        """Sidecar file recording the GCS generation the local database was last synced with."""
+        return self.local_db_path.with_name(f"{self.local_db_path.name}.gen")
+
+    def _read_local_generation(self) -> int | None:
+        """Read the last synced GCS generation, or None if it was never recorded."""
+        try:
+            return int(self._get_generation_path().read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _write_local_generation(self, generation: int | None) -> None:
+        """Record the GCS generation the local database now matches."""
+        if generation is None:
+            return
+        try:
+            self._get_generation_path().write_text(str(generation))
+        except OSError as e:
+            logger.warning(f"Failed to record database generation: {e}")
+
+    def _download_blob(self, blob: storage.Blob, timeout: float, **conditions: int) -> None:
+        """Download blob to a temporary file and move it over the local database once complete."""
+        # Downloading straight onto the live file would truncate it if the request fails
+        # (including a 304 for conditional requests)
+        tmp_path = self.local_db_path.with_suffix(".db.tmp")
+        try:
+            # The database is uploaded without Content-Encoding, so the raw bytes are the file itself;
+            # crc32c validates the transfer end to end
+            blob.download_to_filename(
+                str(tmp_path), raw_download=True, checksum="crc32c", timeout=timeout, **conditions
+            )
+            os.replace(tmp_path, self.local_db_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self._write_local_generation(blob.generation)
+
+    def download_database(self, timeout: float = 60) -> bool:
         """Download database from Cloud Storage to local file."""
         if not self._should_use_cloud_storage():
             return False
@@ -56,12 +107,12 @@ class CloudStorageService:
             blob = bucket.blob(self.db_filename)
 
             # Check if file exists in Cloud Storage
-            if not blob.exists():
+            if not blob.exists(timeout=timeout):
                 logger.info(f"Database file {self.db_filename} not found in Cloud Storage, will create new one")
                 return False
 
             # Download the file
-            blob.download_to_filename(str(self.local_db_path))
+            self._download_blob(blob, timeout)
             logger.info("Successfully downloaded database from Cloud Storage")
             return True
 
@@ -85,6 +136,7 @@ class CloudStorageService:
         try:
             blob = bucket.blob(self.db_filename)
             blob.upload_from_filename(str(self.local_db_path))
+            self._write_local_generation(blob.generation)
             logger.info("Successfully uploaded database to Cloud Storage")
             return True
 
@@ -100,16 +152,9 @@ class CloudStorageService:
 
         logger.info(f"Starting Cloud Storage sync with {timeout_seconds}s timeout")
 
+        # Each GCS request is bounded by the client's own socket timeout, which (unlike
+        # signal.alarm) also works when called off the main thread
         try:
-            import signal
-
-            def timeout_handler(signum: int, frame: object) -> None:
-                raise TimeoutError(f"Cloud Storage sync timed out after {timeout_seconds}s")
-
-            # Set timeout
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(timeout_seconds)
-
             bucket = self._get_bucket()
             if not bucket:
                 logger.warning("Could not get Cloud Storage bucket")
@@ -117,40 +162,49 @@ class CloudStorageService:
 
             blob = bucket.blob(self.db_filename)
 
-            if not blob.exists():
-                logger.info("No database found in Cloud Storage")
-                return False
-
             # If local file doesn't exist, download it
             if not self.local_db_path.exists():
                 logger.info("Local database doesn't exist, downloading from Cloud Storage")
-                result = self.download_database()
-                signal.alarm(0)  # Cancel timeout
-                return result
+                return self.download_database(timeout=timeout_seconds)
+
+            last_generation = self._read_local_generation()
+            if last_generation is not None:
+                # Let GCS compare generations: a 304 means the local copy is current and nothing is transferred
+                try:
+                    self._download_blob(blob, timeout_seconds, if_generation_not_match=last_generation)
+                except NotModified:
+                    logger.info("Local database is up to date")
+                    return True
+                except NotFound:
+                    logger.info("No database found in Cloud Storage")
+                    return False
+
+                logger.info("Cloud database has a newer generation, downloaded")
+                return True
 
-            # Compare modification times
-            blob.reload()  # Refresh blob metadata
+            # No recorded generation yet, fall back to comparing modification times
+            if not blob.exists(timeout=timeout_seconds):
+                logger.info("No database found in Cloud Storage")
+                return False
+
+            blob.reload(timeout=timeout_seconds)  # Refresh blob metadata
             local_mtime = self.local_db_path.stat().st_mtime
             cloud_mtime = blob.updated.timestamp()
 
             if cloud_mtime > local_mtime:
                 logger.info("Cloud database is newer, downloading")
-                result = self.download_database()
-                signal.alarm(0)  # Cancel timeout
-                return result
+                return self.download_database(timeout=timeout_seconds)
             else:
                 logger.info("Local database is up to date")
-                signal.alarm(0)  # Cancel timeout
+                self._write_local_generation(blob.generation)
                 return True
 
-        except TimeoutError as e:
+        except (TimeoutError, DeadlineExceeded) as e:
             logger.warning(f"Cloud Storage sync timed out: {e}")
             return False
         except Exception as e:
             logger.error(f"Failed to sync database from Cloud Storage: {e}")
             return False
-        finally:
-            signal.alarm(0)  # Ensure timeout is canceled
 
     def _should_use_cloud_storage(self) -> bool:
         """Check if Cloud Storage should be used."""
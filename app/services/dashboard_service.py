@@ -1,9 +1,10 @@
-import re
+import threading
+import time
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import ColumnElement, Numeric, Row, and_, case, cast, func, or_, select
 from sqlalchemy.orm import Query, Session
 
 from app.models.risk import Risk, RiskLogEntry
@@ -18,171 +19,239 @@ from app.schemas.dashboard import (
     TopRisk,
 )
 
+# Dashboard payloads are read far more often than risks change, so the last result is reused
+# while the data fingerprint is unchanged and the entry is younger than the TTL.
+_DASHBOARD_CACHE_TTL_SECONDS = 30.0
+_dashboard_cache: tuple[tuple[Any, ...], DashboardData] | None = None
+_cache_ts: float = 0.0
+_dashboard_cache_lock = threading.Lock()
+
+# Built once at import; SQLAlchemy's compiled cache keys on statement structure, so the
+# per-request cost is only the cache lookup rather than rebuilding the IN expression
+_ACTIVE_RISK_FILTER: ColumnElement[bool] = Risk.risk_status.in_(("Active", "Monitoring"))
+
+# Coverage levels that count as a control gap
+_CONTROL_GAP_COVERAGE = ("No Controls", "Incomplete Coverage")
+
+
+def _count_where(condition: ColumnElement[bool]) -> ColumnElement[int]:
+    """Conditional COUNT expression usable inside a single aggregate SELECT."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _net_exposure_is(level: str) -> ColumnElement[bool]:
+    """Match net exposure values of the form "<Level> (<score>)" on the generated severity column."""
+    return Risk.business_disruption_net_severity == level
+
+
+def _controls_adequate(coverage: Any, effectiveness: Any) -> ColumnElement[bool]:
+    """Controls are "adequate" if they have Complete Coverage AND are Fully Effective."""
+    return and_(coverage == "Complete Coverage", effectiveness == "Fully Effective")
+
 
 class DashboardService:
     def __init__(self, db: Session):
         self.db = db
 
     def get_dashboard_data(self) -> DashboardData:
-        """Get all dashboard data."""
+        """Get all dashboard data, reusing the cached result while the underlying data is unchanged."""
+        global _dashboard_cache, _cache_ts
+
+        fingerprint = self._get_data_fingerprint()
+        with _dashboard_cache_lock:
+            if (
+                _dashboard_cache is not None
+                and _dashboard_cache[0] == fingerprint
+                and time.monotonic() - _cache_ts < _DASHBOARD_CACHE_TTL_SECONDS
+            ):
+                return _dashboard_cache[1]
+
+        data = self._build_dashboard_data()
+
+        with _dashboard_cache_lock:
+            _dashboard_cache = (fingerprint, data)
+            _cache_ts = time.monotonic()
+
+        return data
+
+    def _get_data_fingerprint(self) -> tuple[Any, ...]:
+        """Cheap probe that changes whenever risks or log entries are added, modified or removed."""
+        fingerprint = self.db.execute(
+            select(
+                select(func.max(Risk.updated_at)).scalar_subquery(),
+                select(func.count()).select_from(Risk).scalar_subquery(),
+                select(func.max(RiskLogEntry.updated_at)).scalar_subquery(),
+                select(func.count()).select_from(RiskLogEntry).scalar_subquery(),
+            )
+        ).one()
+        return tuple(fingerprint)
+
+    def _build_dashboard_data(self) -> DashboardData:
+        """Compute all dashboard data from the database."""
         active_risks = self._get_active_risks_query()
+        # All Risk-table counts, sums and averages come from one round trip
+        aggregates = self._get_risk_aggregates(active_risks)
+        # With no active risks the per-domain and top-risk lists are empty, so skip those queries
+        has_active_risks = aggregates.total > 0
 
-        return DashboardData(
+        return DashboardData.model_construct(
             # Overall Risk Exposure
-            total_active_risks=self._get_total_active_risks(active_risks),
-            critical_high_risk_count=self._get_critical_high_risk_count(active_risks),
+            total_active_risks=self._get_total_active_risks(active_risks, aggregates),
+            critical_high_risk_count=self._get_critical_high_risk_count(active_risks, aggregates),
             risk_trend_change=self._get_risk_trend_change(),
             # Risk Distribution
-            risk_severity_distribution=self._get_risk_severity_distribution(active_risks),
+            risk_severity_distribution=self._get_risk_severity_distribution(active_risks, aggregates),
             # Technology Domains
-            technology_domain_risks=self._get_technology_domain_risks(active_risks),
+            technology_domain_risks=self._get_technology_domain_risks(active_risks) if has_active_risks else [],
             # Control Posture
-            control_posture=self._get_control_posture(active_risks),
+            control_posture=self._get_control_posture(active_risks, aggregates),
             # Top Priority Risks
-            top_priority_risks=self._get_top_priority_risks(active_risks),
+            top_priority_risks=self._get_top_priority_risks(active_risks) if has_active_risks else [],
             # Risk Response Strategy
-            risk_response_breakdown=self._get_risk_response_breakdown(active_risks),
+            risk_response_breakdown=self._get_risk_response_breakdown(active_risks, aggregates),
             # Financial Impact
-            total_financial_exposure=self._get_total_financial_exposure(active_risks),
-            average_financial_impact=self._get_average_financial_impact(active_risks),
-            high_financial_impact_risks=self._get_high_financial_impact_risks(active_risks),
+            total_financial_exposure=self._get_total_financial_exposure(active_risks, aggregates),
+            average_financial_impact=self._get_average_financial_impact(active_risks, aggregates),
+            high_financial_impact_risks=self._get_high_financial_impact_risks(active_risks, aggregates),
             # Risk Management Activity
             risk_management_activity=self._get_risk_management_activity(),
             # Business Service Exposure
-            business_service_exposure=self._get_business_service_exposure(active_risks),
+            business_service_exposure=self._get_business_service_exposure(active_risks, aggregates),
         )
 
     def _get_active_risks_query(self) -> Query[Any]:
         """Get query for active risks."""
-        return self.db.query(Risk).filter(or_(Risk.risk_status == "Active", Risk.risk_status == "Monitoring"))
-
-    def _get_total_active_risks(self, active_risks: Query[Any]) -> int:
+        return self.db.query(Risk).filter(_ACTIVE_RISK_FILTER)
+
+    def _get_risk_aggregates(self, active_risks: Query[Any]) -> Row[Any]:
+        """Compute every Risk-table dashboard metric in a single conditional-aggregation query."""
+        has_ibs = and_(Risk.ibs_affected.isnot(None), Risk.ibs_affected != "")
+
+        return active_risks.with_entities(  # type: ignore[no-any-return]
+            func.count().label("total"),
+            # Severity buckets based on net exposure, all classified in the same pass
+            _count_where(_net_exposure_is("Critical")).label("critical"),
+            _count_where(_net_exposure_is("High")).label("high"),
+            _count_where(_net_exposure_is("Medium")).label("medium"),
+            _count_where(_net_exposure_is("Low")).label("low"),
+            # Control posture
+            _count_where(
+                _controls_adequate(Risk.preventative_controls_coverage, Risk.preventative_controls_effectiveness)
+            ).label("preventative_adequate"),
+            _count_where(
+                _controls_adequate(Risk.detective_controls_coverage, Risk.detective_controls_effectiveness)
+            ).label("detective_adequate"),
+            _count_where(
+                _controls_adequate(Risk.corrective_controls_coverage, Risk.corrective_controls_effectiveness)
+            ).label("corrective_adequate"),
+            _count_where(
+                or_(
+                    Risk.preventative_controls_coverage.in_(_CONTROL_GAP_COVERAGE),
+                    Risk.detective_controls_coverage.in_(_CONTROL_GAP_COVERAGE),
+                    Risk.corrective_controls_coverage.in_(_CONTROL_GAP_COVERAGE),
+                )
+            ).label("control_gaps"),
+            # Risk response strategy
+            _count_where(Risk.risk_response_strategy == "Mitigate").label("mitigate"),
+            _count_where(Risk.risk_response_strategy == "Accept").label("accept"),
+            _count_where(Risk.risk_response_strategy == "Transfer").label("transfer"),
+            _count_where(Risk.risk_response_strategy == "Avoid").label("avoid"),
+            # Financial impact
+            func.sum(Risk.financial_impact_high).label("total_financial_exposure"),
+            # Cast server-side so the driver returns a Decimal rather than AVG's float
+            cast(func.avg(Risk.financial_impact_high), Numeric(12, 2)).label("average_financial_impact"),
+            _count_where(Risk.financial_impact_high > 1000000).label("high_financial_impact"),
+            # Business service exposure
+            _count_where(has_ibs).label("ibs_risks"),
+            func.coalesce(func.sum(Risk.ibs_affected_count), 0).label("ibs_affected_total"),
+            _count_where(and_(has_ibs, _net_exposure_is("Critical"))).label("critical_ibs_risks"),
+        ).one()
+
+    def _get_total_active_risks(self, active_risks: Query[Any], aggregates: Row[Any] | None = None) -> int:
         """Get total count of active risks."""
-        return active_risks.count()  # type: ignore[no-any-return]
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+        return int(aggregates.total)
 
-    def _get_critical_high_risk_count(self, active_risks: Query[Any]) -> int:
+    def _get_critical_high_risk_count(self, active_risks: Query[Any], aggregates: Row[Any] | None = None) -> int:
         """Get count of critical/high risks based on net exposure."""
-        # Count risks with Critical or High net exposure
-        return active_risks.filter(
-            or_(
-                Risk.business_disruption_net_exposure.like("%Critical%"),
-                Risk.business_disruption_net_exposure.like("%High%"),
-            )
-        ).count()  # type: ignore[no-any-return]
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+        return int(aggregates.critical + aggregates.high)
 
     def _get_risk_trend_change(self) -> float:
         """Calculate month-over-month risk trend change."""
-        # Get current month count
-        date.today().replace(day=1)
-        self._get_active_risks_query().count()
-
-        # Get previous month count (simplified - would need historical tracking)
+        # Previous month count would need historical tracking
         # For now, return 0 as baseline
         return 0.0
 
-    def _get_risk_severity_distribution(self, active_risks: Query[Any]) -> RiskSeverityDistribution:
+    def _get_risk_severity_distribution(
+        self, active_risks: Query[Any], aggregates: Row[Any] | None = None
+    ) -> RiskSeverityDistribution:
         """Get risk distribution by Business Disruption net exposure levels."""
-        critical = active_risks.filter(Risk.business_disruption_net_exposure.like("%Critical%")).count()
-
-        high = active_risks.filter(Risk.business_disruption_net_exposure.like("%High%")).count()
-
-        medium = active_risks.filter(Risk.business_disruption_net_exposure.like("%Medium%")).count()
-
-        low = active_risks.filter(Risk.business_disruption_net_exposure.like("%Low%")).count()
-
-        return RiskSeverityDistribution(critical=critical, high=high, medium=medium, low=low)
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+
+        return RiskSeverityDistribution.model_construct(
+            critical=aggregates.critical,
+            high=aggregates.high,
+            medium=aggregates.medium,
+            low=aggregates.low,
+        )
 
     def _get_technology_domain_risks(self, active_risks: Query[Any]) -> list[TechnologyDomainRisk]:
         """Get risk count and average net exposure score by technology domain."""
-        # Get all risks grouped by domain
-        all_risks = active_risks.all()
-
-        # Group by domain and calculate averages
-        domain_data: dict[str, list[int]] = {}
-        for risk in all_risks:
-            domain = risk.technology_domain
-            if domain not in domain_data:
-                domain_data[domain] = []
-
-            # Extract numeric score from net exposure string like "Critical (15)"
-            exposure = risk.business_disruption_net_exposure or "Low (1)"
-            match = re.search(r"\((\d+)\)", exposure)
-            score = int(match.group(1)) if match else 1
-            domain_data[domain].append(score)
-
-        # Calculate final results
-        final_results = []
-        for domain, scores in domain_data.items():
-            risk_count = len(scores)
-            avg_score = sum(scores) / risk_count if risk_count > 0 else 0.0
-
-            final_results.append(
-                TechnologyDomainRisk(
-                    domain=domain,
-                    risk_count=risk_count,
-                    average_risk_rating=avg_score,
-                )
-            )
+        # Aggregate in SQL and stream the per-domain rows straight into the response models
+        rows = active_risks.with_entities(
+            Risk.technology_domain,
+            func.count().label("risk_count"),
+            func.avg(func.coalesce(Risk.business_disruption_net_exposure_score, 1)).label("average_score"),
+        ).group_by(Risk.technology_domain)
 
-        return final_results
+        return [
+            TechnologyDomainRisk.model_construct(
+                domain=domain,
+                risk_count=risk_count,
+                average_risk_rating=float(average_score or 0.0),
+            )
+            for domain, risk_count, average_score in rows.yield_per(100)
+        ]
 
-    def _get_control_posture(self, active_risks: Query[Any]) -> ControlPosture:
+    def _get_control_posture(self, active_risks: Query[Any], aggregates: Row[Any] | None = None) -> ControlPosture:
         """Get control posture statistics based on new coverage/effectiveness model."""
-        total_risks = active_risks.count()
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+
+        total_risks = aggregates.total
         if total_risks == 0:
-            return ControlPosture(
+            return ControlPosture.model_construct(
                 preventative_adequate_percentage=0.0,
                 detective_adequate_percentage=0.0,
                 corrective_adequate_percentage=0.0,
                 risks_with_control_gaps=0,
             )
 
-        # Consider controls "adequate" if they have Complete Coverage AND Fully Effective
-        preventative_adequate = active_risks.filter(
-            and_(
-                Risk.preventative_controls_coverage == "Complete Coverage",
-                Risk.preventative_controls_effectiveness == "Fully Effective",
-            )
-        ).count()
-
-        detective_adequate = active_risks.filter(
-            and_(
-                Risk.detective_controls_coverage == "Complete Coverage",
-                Risk.detective_controls_effectiveness == "Fully Effective",
-            )
-        ).count()
-
-        corrective_adequate = active_risks.filter(
-            and_(
-                Risk.corrective_controls_coverage == "Complete Coverage",
-                Risk.corrective_controls_effectiveness == "Fully Effective",
-            )
-        ).count()
-
-        # Count risks with control gaps (No Controls or Incomplete Coverage)
-        control_gaps = active_risks.filter(
-            or_(
-                Risk.preventative_controls_coverage == "No Controls",
-                Risk.detective_controls_coverage == "No Controls",
-                Risk.corrective_controls_coverage == "No Controls",
-                Risk.preventative_controls_coverage == "Incomplete Coverage",
-                Risk.detective_controls_coverage == "Incomplete Coverage",
-                Risk.corrective_controls_coverage == "Incomplete Coverage",
-            )
-        ).count()
-
-        return ControlPosture(
-            preventative_adequate_percentage=(preventative_adequate / total_risks) * 100,
-            detective_adequate_percentage=(detective_adequate / total_risks) * 100,
-            corrective_adequate_percentage=(corrective_adequate / total_risks) * 100,
-            risks_with_control_gaps=control_gaps,
+        return ControlPosture.model_construct(
+            preventative_adequate_percentage=(aggregates.preventative_adequate / total_risks) * 100,
+            detective_adequate_percentage=(aggregates.detective_adequate / total_risks) * 100,
+            corrective_adequate_percentage=(aggregates.corrective_adequate / total_risks) * 100,
+            risks_with_control_gaps=aggregates.control_gaps,
         )
 
     def _get_top_priority_risks(self, active_risks: Query[Any]) -> list[TopRisk]:
         """Get top 10 highest priority risks with intelligent sorting based on net exposure."""
-        risks = (
-            active_risks.order_by(
-                Risk.business_disruption_net_exposure.desc(),
+        # Select only the projected columns so no Risk ORM instances are hydrated
+        risks: list[Any] = (
+            active_risks.with_entities(
+                Risk.risk_id,
+                Risk.risk_title,
+                Risk.business_disruption_net_exposure,
+                Risk.financial_impact_high,
+                Risk.ibs_affected,
+                Risk.risk_owner,
+            )
+            .order_by(
+                Risk.business_disruption_net_exposure_score.desc(),
                 Risk.financial_impact_high.desc().nulls_last(),
                 Risk.ibs_affected.desc().nulls_last(),
             )
@@ -191,7 +260,7 @@ class DashboardService:
         )
 
         return [
-            TopRisk(
+            TopRisk.model_construct(
                 risk_id=risk.risk_id,
                 risk_title=risk.risk_title,
                 business_disruption_net_exposure=risk.business_disruption_net_exposure,
@@ -202,81 +271,100 @@ class DashboardService:
             for risk in risks
         ]
 
-    def _get_risk_response_breakdown(self, active_risks: Query[Any]) -> RiskResponseBreakdown:
+    def _get_risk_response_breakdown(
+        self, active_risks: Query[Any], aggregates: Row[Any] | None = None
+    ) -> RiskResponseBreakdown:
         """Get risk response strategy breakdown."""
-        mitigate = active_risks.filter(Risk.risk_response_strategy == "Mitigate").count()
-        accept = active_risks.filter(Risk.risk_response_strategy == "Accept").count()
-        transfer = active_risks.filter(Risk.risk_response_strategy == "Transfer").count()
-        avoid = active_risks.filter(Risk.risk_response_strategy == "Avoid").count()
-
-        return RiskResponseBreakdown(mitigate=mitigate, accept=accept, transfer=transfer, avoid=avoid)
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+
+        return RiskResponseBreakdown.model_construct(
+            mitigate=aggregates.mitigate,
+            accept=aggregates.accept,
+            transfer=aggregates.transfer,
+            avoid=aggregates.avoid,
+        )
 
-    def _get_total_financial_exposure(self, active_risks: Query[Any]) -> Decimal:
+    def _get_total_financial_exposure(self, active_risks: Query[Any], aggregates: Row[Any] | None = None) -> Decimal:
         """Get total financial exposure (sum of high estimates)."""
-        result = active_risks.with_entities(func.sum(Risk.financial_impact_high)).scalar()
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+        result = aggregates.total_financial_exposure
 
         return result if result else Decimal("0.00")
 
-    def _get_average_financial_impact(self, active_risks: Query[Any]) -> Decimal:
+    def _get_average_financial_impact(self, active_risks: Query[Any], aggregates: Row[Any] | None = None) -> Decimal:
         """Get average financial impact per risk."""
-        result = active_risks.with_entities(func.avg(Risk.financial_impact_high)).scalar()
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+        result = aggregates.average_financial_impact
 
-        return Decimal(str(result)) if result else Decimal("0.00")
+        return result if result else Decimal("0.00")
 
-    def _get_high_financial_impact_risks(self, active_risks: Query[Any]) -> int:
+    def _get_high_financial_impact_risks(self, active_risks: Query[Any], aggregates: Row[Any] | None = None) -> int:
         """Get count of risks with financial impact > $1M."""
-        return active_risks.filter(Risk.financial_impact_high > 1000000).count()  # type: ignore[no-any-return]
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
+        return int(aggregates.high_financial_impact)
 
     def _get_risk_management_activity(self) -> RiskManagementActivity:
         """Get risk management activity metrics."""
-        current_month_start = date.today().replace(day=1)
+        today = date.today()
+        current_month_start = today.replace(day=1)
 
-        # Risks reviewed this month
-        reviewed_this_month = self.db.query(Risk).filter(Risk.last_reviewed >= current_month_start).count()
-
-        # Overdue reviews
-        overdue_reviews = self.db.query(Risk).filter(Risk.next_review_date < date.today()).count()
+        thirty_days_ago = today - timedelta(days=30)
 
+        # Risks reviewed this month and overdue reviews in a single scan of the risks table
+        review_counts = select(
+            _count_where(Risk.last_reviewed >= current_month_start).label("reviewed_this_month"),
+            _count_where(Risk.next_review_date < today).label("overdue_reviews"),
+        ).subquery()
         # Recent rating changes (last 30 days)
-        thirty_days_ago = date.today() - timedelta(days=30)
         recent_changes = (
-            self.db.query(RiskLogEntry)
-            .filter(
-                and_(
-                    RiskLogEntry.entry_date >= thirty_days_ago,
-                    RiskLogEntry.entry_type == "Risk Assessment Update",
-                )
+            select(func.count())
+            .select_from(RiskLogEntry)
+            .where(
+                RiskLogEntry.entry_type == "Risk Assessment Update",
+                RiskLogEntry.entry_date >= thirty_days_ago,
             )
-            .count()
+            .scalar_subquery()
         )
 
-        return RiskManagementActivity(
-            risks_reviewed_this_month=reviewed_this_month,
-            overdue_reviews=overdue_reviews,
-            recent_risk_rating_changes=recent_changes,
+        # Both tables are read in one round trip
+        activity = self.db.execute(
+            select(
+                review_counts.c.reviewed_this_month,
+                review_counts.c.overdue_reviews,
+                recent_changes.label("recent_changes"),
+            )
+        ).one()
+
+        return RiskManagementActivity.model_construct(
+            risks_reviewed_this_month=activity.reviewed_this_month,
+            overdue_reviews=activity.overdue_reviews,
+            recent_risk_rating_changes=activity.recent_changes,
         )
 
-    def _get_business_service_exposure(self, active_risks: Query[Any]) -> BusinessServiceExposure:
+    def _get_business_service_exposure(
+        self, active_risks: Query[Any], aggregates: Row[Any] | None = None
+    ) -> BusinessServiceExposure:
         """Get business service exposure metrics based on new IBS affected field."""
-        total_active = active_risks.count()
+        if aggregates is None:
+            aggregates = self._get_risk_aggregates(active_risks)
 
-        # Risks affecting IBS (now a text field, check for non-empty values)
-        ibs_risks = active_risks.filter(and_(Risk.ibs_affected.isnot(None), Risk.ibs_affected != ""))  # type: ignore[arg-type]
-        ibs_risk_count = ibs_risks.count()
+        total_active = aggregates.total
+        # Risks affecting IBS (now a text field, counted when non-empty)
+        ibs_risk_count = aggregates.ibs_risks
 
-        # For total IBS affected, we'll estimate based on the count since it's now text
-        # In a real implementation, you might parse the text to extract numbers
-        total_ibs_affected = ibs_risk_count  # Simplified: assume 1 IBS per risk with IBS impact
+        # Total services named across those risks, from the generated ibs_affected_count column
+        total_ibs_affected = aggregates.ibs_affected_total
 
         # Percentage with IBS impact
         percentage_with_ibs = (ibs_risk_count / total_active * 100) if total_active > 0 else 0.0
 
-        # Critical risks affecting IBS (based on net exposure)
-        critical_ibs_risks = ibs_risks.filter(Risk.business_disruption_net_exposure.like("%Critical%")).count()
-
-        return BusinessServiceExposure(
+        return BusinessServiceExposure.model_construct(
             risks_affecting_ibs=ibs_risk_count,
             total_ibs_affected=total_ibs_affected,
             percentage_risks_with_ibs_impact=percentage_with_ibs,
-            critical_risks_affecting_ibs=critical_ibs_risks,
+            critical_risks_affecting_ibs=aggregates.critical_ibs_risks,
         )
@@ -1,52 +1,117 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models.risk import DropdownValue
 from app.schemas.risk import DropdownValue as DropdownValueSchema
 
+# Columns exposed by the DropdownValue response schema. Selecting these directly returns
+# lightweight Row tuples and skips ORM instance construction and identity-map bookkeeping.
+_DROPDOWN_COLUMNS = (
+    DropdownValue.id,
+    DropdownValue.category,
+    DropdownValue.value,
+    DropdownValue.display_order,
+    DropdownValue.is_active,
+)
+
+# Dropdown values are read on every form load but only change when seeded or edited, so the
+# active set is cached in-process. ORM writes and table (re)creation invalidate it immediately;
+# the TTL bounds staleness for out-of-process changes such as a database synced from Cloud Storage.
+_DROPDOWN_CACHE_TTL_SECONDS = 300.0
+_dropdown_cache: tuple[list[Any], dict[str, list[Any]]] | None = None
+_cache_ts: float = 0.0
+_cache_version = 0
+_dropdown_cache_lock = threading.Lock()
+
+
+def invalidate_dropdown_cache() -> None:
+    """Drop the cached dropdown values so the next read reloads them."""
+    global _dropdown_cache, _cache_version
+    with _dropdown_cache_lock:
+        _dropdown_cache = None
+        _cache_version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _track_dropdown_changes(session: Session, flush_context: Any) -> None:
+    """Remember that this transaction wrote dropdown values."""
+    if any(isinstance(obj, DropdownValue) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["dropdown_values_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_dropdown_commit(session: Session) -> None:
+    """Invalidate once the changes are committed, so other sessions reload the new values."""
+    if session.info.pop("dropdown_values_changed", False):
+        invalidate_dropdown_cache()
+
+
+@event.listens_for(DropdownValue.__table__, "after_create")
+@event.listens_for(DropdownValue.__table__, "after_drop")
+def _invalidate_on_table_ddl(target: Any, connection: Any, **kw: Any) -> None:
+    invalidate_dropdown_cache()
+
 
 class DropdownService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _get_active_values(self) -> tuple[list[Any], dict[str, list[Any]]]:
+        """Return all active values ordered by display order, and the same values grouped by category."""
+        global _dropdown_cache, _cache_ts
+
+        with _dropdown_cache_lock:
+            if _dropdown_cache is not None and time.monotonic() - _cache_ts < _DROPDOWN_CACHE_TTL_SECONDS:
+                return _dropdown_cache
+            version = _cache_version
+
+        # One query loads every category; grouping preserves the display order within each category
+        rows: list[Any] = (
+            self.db.query(*_DROPDOWN_COLUMNS)
+            .filter(DropdownValue.is_active)
+            .order_by(DropdownValue.display_order, DropdownValue.value)
+            .all()
+        )
+        grouped: defaultdict[str, list[Any]] = defaultdict(list)
+        for row in rows:
+            grouped[row.category].append(row)
+        by_category = {category: grouped[category] for category in sorted(grouped)}
+
+        with _dropdown_cache_lock:
+            # Skip storing if an invalidation raced with this load, so stale values are not cached
+            if _cache_version == version:
+                _dropdown_cache = (rows, by_category)
+                _cache_ts = time.monotonic()
+        return rows, by_category
+
     def get_dropdown_values(self, category: str | None = None) -> list[DropdownValueSchema]:
         """Get dropdown values, optionally filtered by category."""
-        query = self.db.query(DropdownValue).filter(DropdownValue.is_active)
+        rows, by_category = self._get_active_values()
 
         if category:
-            query = query.filter(DropdownValue.category == category)
+            return list(by_category.get(category, []))
 
-        return query.order_by(DropdownValue.display_order, DropdownValue.value).all()  # type: ignore[return-value]
+        return list(rows)
 
     def get_dropdown_categories(self) -> list[str]:
         """Get all available dropdown categories."""
-        categories = (
-            self.db.query(DropdownValue.category)
-            .filter(DropdownValue.is_active)
-            .distinct()
-            .order_by(DropdownValue.category)
-            .all()
-        )
-        return [category[0] for category in categories]
+        _, by_category = self._get_active_values()
+        return list(by_category)
 
     def get_dropdown_values_by_categories(
         self, categories: list[str] | None = None
     ) -> dict[str, list[DropdownValueSchema]]:
         """Get dropdown values grouped by category."""
+        _, by_category = self._get_active_values()
+
         if categories:
             # Get specific categories
-            query = self.db.query(DropdownValue).filter(DropdownValue.is_active, DropdownValue.category.in_(categories))
-        else:
-            # Get all categories
-            query = self.db.query(DropdownValue).filter(DropdownValue.is_active)
-
-        dropdown_values = query.order_by(DropdownValue.category, DropdownValue.display_order, DropdownValue.value).all()
-
-        # Group by category
-        result: dict[str, list[DropdownValueSchema]] = {}
-        for dropdown_value in dropdown_values:
-            cat = str(dropdown_value.category)
-            if cat not in result:
-                result[cat] = []
-            result[cat].append(dropdown_value)  # type: ignore[arg-type]
-
-        return result
+            requested = set(categories)
+            return {category: list(values) for category, values in by_category.items() if category in requested}
+
+        return {category: list(values) for category, values in by_category.items()}
@@ -1,42 +1,150 @@
-from datetime import date, datetime
-
-from sqlalchemy.orm import Session
+import base64
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    Subquery,
+    and_,
+    bindparam,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.orm import ORMExecuteState, Query, Session, joinedload
 
 from app.core.sync import sync_database_after_write
-from app.models.risk import Risk, RiskLogEntry
+from app.models.risk import IdCounter, Risk, RiskLogEntry, net_exposure_for
 
 # Legacy import for backward compatibility
 from app.schemas.risk import RiskCreate, RiskLogEntryCreate, RiskLogEntryUpdate
 from app.schemas.risk import RiskUpdate as RiskUpdateSchema
 
+_CATEGORY_ABBREVIATIONS = {
+    "Cybersecurity": "CYB",
+    "Infrastructure": "INF",
+    "Application": "APP",
+    "Data Management": "DAT",
+    "Cloud Services": "CLD",
+    "Vendor/Third Party": "VEN",
+    "Regulatory/Compliance": "REG",
+    "Operational": "OPS",
+}
+
+# Risk level indexed by rating: 1-3 Low, 4-6 Medium, 8-12 High, 15-25 Critical; the gaps are "Unknown"
+_RISK_LEVELS: tuple[str, ...] = (
+    ("Unknown",) + ("Low",) * 3 + ("Medium",) * 3 + ("Unknown",) + ("High",) * 5 + ("Unknown",) * 2 + ("Critical",) * 11
+)
+
+# Single-row lookups by primary key, built once so each call reuses the compiled statement
+_GET_RISK_STMT = select(Risk).where(Risk.risk_id == bindparam("risk_id"))
+_GET_LOG_ENTRY_STMT = select(RiskLogEntry).where(RiskLogEntry.log_entry_id == bindparam("log_entry_id"))
+
+# Listing pages repeat the same filter/sort/page combinations across users, so the risk IDs and
+# total of recently served pages are cached in-process. Committed ORM writes to risks and table
+# (re)creation clear the cache; the TTL bounds staleness for out-of-process changes.
+_RISKS_PAGE_CACHE_TTL_SECONDS = 30.0
+_RISKS_PAGE_CACHE_MAX_ENTRIES = 512
+_risks_page_cache: OrderedDict[tuple[Any, ...], tuple[float, list[str], int]] = OrderedDict()
+_risks_page_cache_version = 0
+_risks_page_cache_lock = threading.Lock()
+
+
+def invalidate_risks_page_cache() -> None:
+    """Drop all cached risk listing pages."""
+    global _risks_page_cache_version
+    with _risks_page_cache_lock:
+        _risks_page_cache.clear()
+        _risks_page_cache_version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _track_risk_changes(session: Session, flush_context: Any) -> None:
+    """Remember that this transaction wrote risks."""
+    if any(isinstance(obj, Risk) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["risks_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_risk_statements(orm_execute_state: ORMExecuteState) -> None:
+    """Remember that this transaction ran an ORM UPDATE or DELETE statement against risks."""
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper is inspect(Risk):
+        orm_execute_state.session.info["risks_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_risk_commit(session: Session) -> None:
+    """Invalidate once the changes are committed, so other sessions see them."""
+    if session.info.pop("risks_changed", False):
+        invalidate_risks_page_cache()
+
+
+@event.listens_for(Risk.__table__, "after_create")
+@event.listens_for(Risk.__table__, "after_drop")
+def _invalidate_on_table_ddl(target: Any, connection: Any, **kw: Any) -> None:
+    invalidate_risks_page_cache()
+
+
+def _encode_cursor(net_exposure: str, risk_id: str) -> str:
+    """Encode the default-order sort key of the last row as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(json.dumps([net_exposure, risk_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        net_exposure, risk_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    return str(net_exposure), str(risk_id)
+
 
 class RiskService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_risks(
+    def _apply_risk_filters(
         self,
-        skip: int = 0,
-        limit: int = 100,
+        query: Query[Any],
         category: str | None = None,
         status: str | None = None,
         search: str | None = None,
-        sort_by: str | None = None,
-        sort_order: str = "asc",
-    ) -> list[Risk]:
-        """Get risks with optional filtering, searching, and sorting."""
-        query = self.db.query(Risk)
-
-        # Apply filters
+    ) -> Query[Any]:
+        """Apply the category, status and search filters shared by risk listing and counting."""
         if category:
             query = query.filter(Risk.risk_category == category)
         if status:
             query = query.filter(Risk.risk_status == status)
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(Risk.risk_title.ilike(search_term) | Risk.risk_description.ilike(search_term))
-
-        # Apply sorting
+            if len(search) >= 3 and self.db.get_bind().dialect.name == "sqlite":
+                # Trigram FTS phrase query: a case-insensitive substring match served by risks_fts
+                phrase = '"' + search.replace('"', '""') + '"'
+                query = query.filter(
+                    literal_column("risks.rowid").in_(
+                        select(literal_column("rowid"))
+                        .select_from(table("risks_fts"))
+                        .where(literal_column("risks_fts").op("MATCH")(phrase))
+                    )
+                )
+            else:
+                # Terms shorter than one trigram cannot use the index
+                search_term = f"%{search}%"
+                query = query.filter(Risk.risk_title.ilike(search_term) | Risk.risk_description.ilike(search_term))
+        return query
+
+    def _apply_risk_sorting(self, query: Query[Any], sort_by: str | None, sort_order: str) -> Query[Any]:
+        """Apply the requested sort, defaulting to net exposure (Critical first) then risk_id."""
         if sort_by:
             sort_column = getattr(Risk, sort_by, None)
             if sort_column is not None:
@@ -47,8 +155,161 @@ class RiskService:
         else:
             # Default sorting by net exposure (Critical first), then by risk_id
             query = query.order_by(Risk.business_disruption_net_exposure.desc(), Risk.risk_id)
+        return query
+
+    def get_risks_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+    ) -> tuple[list[Risk], int]:
+        """Get a page of risks and the total matching count.
+
+        Recently served pages are cached as risk IDs plus total, so a repeat request only reads the
+        page's rows by primary key.
+        """
+        key = (category, status, search, sort_by, sort_order, skip, limit)
+        now = time.monotonic()
+        with _risks_page_cache_lock:
+            cached = _risks_page_cache.get(key)
+            if cached is not None and now - cached[0] < _RISKS_PAGE_CACHE_TTL_SECONDS:
+                _risks_page_cache.move_to_end(key)
+                risk_ids, total = cached[1], cached[2]
+            else:
+                risk_ids = None
+            version = _risks_page_cache_version
+
+        if risk_ids is not None:
+            if not risk_ids:
+                return [], total
+            by_id = {str(risk.risk_id): risk for risk in self.db.query(Risk).filter(Risk.risk_id.in_(risk_ids))}
+            return [by_id[risk_id] for risk_id in risk_ids if risk_id in by_id], total
+
+        risks, total = self._query_risks_page(skip, limit, category, status, search, sort_by, sort_order)
+
+        with _risks_page_cache_lock:
+            # Skip storing if a write was committed during the load, so a stale page is not cached
+            if _risks_page_cache_version == version:
+                _risks_page_cache[key] = (now, [str(risk.risk_id) for risk in risks], total)
+                _risks_page_cache.move_to_end(key)
+                while len(_risks_page_cache) > _RISKS_PAGE_CACHE_MAX_ENTRIES:
+                    _risks_page_cache.popitem(last=False)
+        return risks, total
+
+    def _query_risks_page(
+        self,
+        skip: int,
+        limit: int,
+        category: str | None,
+        status: str | None,
+        search: str | None,
+        sort_by: str | None,
+        sort_order: str,
+    ) -> tuple[list[Risk], int]:
+        """Read a page of risks and the total matching count in a single query."""
+        if skip == 0:
+            # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every row carries the full total
+            query = self._apply_risk_filters(
+                self.db.query(Risk, func.count().over().label("total")), category, status, search
+            )
+            rows = self._apply_risk_sorting(query, sort_by, sort_order).limit(limit).all()
+        else:
+            page = self._get_page_ids(
+                self.db.query(Risk.risk_id, func.count().over().label("total")),
+                skip,
+                limit,
+                category,
+                status,
+                search,
+                sort_by,
+                sort_order,
+            )
+            query = self.db.query(Risk, page.c.total).join(page, Risk.risk_id == page.c.risk_id)
+            rows = self._apply_risk_sorting(query, sort_by, sort_order).all()
 
-        return query.offset(skip).limit(limit).all()
+        if rows:
+            return [row.Risk for row in rows], rows[0].total
+        if skip > 0:
+            # A page past the end carries no rows to read the total from
+            return [], self.get_risks_count(category=category, status=status, search=search)
+        return [], 0
+
+    def get_risks_after(
+        self,
+        cursor: str | None = None,
+        limit: int = 100,
+        category: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> tuple[list[Risk], str | None]:
+        """Get the next page of risks in default order using keyset pagination.
+
+        Returns the page and an opaque cursor for the following page (None on the last page).
+        Unlike skip/limit this seeks straight to the last seen key instead of walking skipped rows.
+        """
+        query = self._apply_risk_filters(self.db.query(Risk), category, status, search)
+        if cursor:
+            last_exposure, last_risk_id = _decode_cursor(cursor)
+            # Continue after (last_exposure DESC, last_risk_id ASC)
+            query = query.filter(
+                or_(
+                    Risk.business_disruption_net_exposure < last_exposure,  # type: ignore[arg-type]
+                    and_(
+                        Risk.business_disruption_net_exposure == last_exposure,
+                        Risk.risk_id > last_risk_id,  # type: ignore[arg-type]
+                    ),
+                )
+            )
+
+        risks = self._apply_risk_sorting(query, None, "asc").limit(limit).all()
+        if len(risks) < limit:
+            return risks, None
+        last = risks[-1]
+        return risks, _encode_cursor(str(last.business_disruption_net_exposure), str(last.risk_id))
+
+    def get_risks(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+    ) -> list[Risk]:
+        """Get risks with optional filtering, searching, and sorting."""
+        if skip == 0:
+            query = self._apply_risk_filters(self.db.query(Risk), category, status, search)
+            return self._apply_risk_sorting(query, sort_by, sort_order).limit(limit).all()
+
+        page = self._get_page_ids(
+            self.db.query(Risk.risk_id), skip, limit, category, status, search, sort_by, sort_order
+        )
+        query = self.db.query(Risk).join(page, Risk.risk_id == page.c.risk_id)
+        return self._apply_risk_sorting(query, sort_by, sort_order).all()
+
+    def _get_page_ids(
+        self,
+        query: Query[Any],
+        skip: int,
+        limit: int,
+        category: str | None,
+        status: str | None,
+        search: str | None,
+        sort_by: str | None,
+        sort_order: str,
+    ) -> Subquery:
+        """Subquery of the risk_ids on the requested page (deferred join for deep offsets).
+
+        Skipped rows are walked on the narrow risk_id projection; full rows are only read for the
+        page itself when the caller joins back to risks.
+        """
+        query = self._apply_risk_filters(query, category, status, search)
+        return self._apply_risk_sorting(query, sort_by, sort_order).offset(skip).limit(limit).subquery()
 
     def get_risks_count(
         self,
@@ -57,22 +318,33 @@ class RiskService:
         search: str | None = None,
     ) -> int:
         """Get total count of risks with same filtering as get_risks."""
-        query = self.db.query(Risk)
-
-        # Apply same filters as get_risks
-        if category:
-            query = query.filter(Risk.risk_category == category)
-        if status:
-            query = query.filter(Risk.risk_status == status)
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(Risk.risk_title.ilike(search_term) | Risk.risk_description.ilike(search_term))
-
-        return query.count()
+        return self._apply_risk_filters(self.db.query(Risk), category, status, search).count()
+
+    def get_risks_count_estimate(self) -> int:
+        """Approximate total number of risks, read from planner statistics instead of scanning the table.
+
+        Suitable for "about N risks" badges; use get_risks_count where an exact or filtered count is
+        needed. Falls back to the exact count when no statistics have been gathered yet.
+        """
+        dialect = self.db.get_bind().dialect.name
+        estimate = None
+        if dialect == "sqlite":
+            # sqlite_stat1 only exists once ANALYZE has run; the first number in stat is the row count
+            if self.db.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")).first():
+                stat = self.db.execute(text("SELECT stat FROM sqlite_stat1 WHERE tbl = 'risks' LIMIT 1")).scalar()
+                estimate = int(stat.split()[0]) if stat else None
+        elif dialect == "postgresql":
+            reltuples = self.db.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'risks'")).scalar()
+            # reltuples is -1 for a table that has never been vacuumed or analyzed
+            estimate = reltuples if reltuples is not None and reltuples >= 0 else None
+
+        if estimate is None:
+            return self.get_risks_count()
+        return int(estimate)
 
     def get_risk(self, risk_id: str) -> Risk | None:
         """Get a single risk by ID."""
-        return self.db.query(Risk).filter(Risk.risk_id == risk_id).first()
+        return self.db.execute(_GET_RISK_STMT, {"risk_id": risk_id}).scalar_one_or_none()
 
     @sync_database_after_write
     def create_risk(self, risk_data: RiskCreate) -> Risk:
@@ -81,13 +353,13 @@ class RiskService:
         risk_id = risk_data.risk_id or self._generate_risk_id()
 
         # Create risk with calculated net exposure
-        risk_dict = risk_data.dict(exclude={"risk_id"})
+        risk_dict = risk_data.model_dump(exclude={"risk_id"})
         db_risk = Risk(risk_id=risk_id, **risk_dict)
         db_risk.calculate_net_exposure()
 
+        # Flush rather than commit so the risk and its initial log entry share one transaction
         self.db.add(db_risk)
-        self.db.commit()
-        self.db.refresh(db_risk)
+        self.db.flush()
 
         # Create initial log entry
         self._create_log_entry(
@@ -104,23 +376,76 @@ class RiskService:
 
         return db_risk
 
+    def get_existing_risk_ids(self, risk_ids: list[str]) -> set[str]:
+        """Return which of the given risk IDs are already in the register."""
+        if not risk_ids:
+            return set()
+        return set(self.db.scalars(select(Risk.risk_id).where(Risk.risk_id.in_(risk_ids))))
+
+    @sync_database_after_write
+    def bulk_create_risks(self, risks_data: list[RiskCreate]) -> list[Risk]:
+        """Create many risks, each with its creation log entry, in a single transaction.
+
+        Intended for imports. Risks without a risk_id get consecutive IDs reserved with one
+        counter update. Returns the created risks in input order.
+        """
+        missing = sum(1 for risk_data in risks_data if not risk_data.risk_id)
+        year = datetime.now().year
+        first = self._next_sequence(f"risk:{year}", Risk.risk_id, f"TR-{year}-", missing) if missing else 0
+        generated_ids = (f"TR-{year}-{sequence:03d}" for sequence in range(first, first + missing))
+
+        db_risks = []
+        for risk_data in risks_data:
+            db_risk = Risk(
+                risk_id=risk_data.risk_id or next(generated_ids), **risk_data.model_dump(exclude={"risk_id"})
+            )
+            db_risk.calculate_net_exposure()
+            db_risks.append(db_risk)
+        self.db.add_all(db_risks)
+        self.db.flush()
+
+        for db_risk in db_risks:
+            self._create_log_entry(
+                risk_id=str(db_risk.risk_id),
+                entry_type="Risk Creation",
+                entry_summary="Risk initially created in the system",
+                created_by=str(db_risk.risk_owner),
+                new_net_exposure=str(db_risk.business_disruption_net_exposure),
+                new_impact_rating=str(db_risk.business_disruption_impact_rating),
+                new_likelihood_rating=str(db_risk.business_disruption_likelihood_rating),
+                risk_owner_at_time=str(db_risk.risk_owner),
+            )
+        self.db.commit()
+
+        return db_risks
+
     @sync_database_after_write
     def update_risk(self, risk_id: str, risk_data: RiskUpdateSchema) -> Risk | None:
         """Update an existing risk."""
-        db_risk = self.get_risk(risk_id)
-        if not db_risk:
+        # Only the previous net exposure is needed for the audit diff, not the full row
+        previous: Any = self.db.execute(
+            select(Risk.business_disruption_net_exposure).where(Risk.risk_id == risk_id)
+        ).first()
+        if previous is None:
             return None
+        previous_exposure = previous.business_disruption_net_exposure
 
-        # Store previous net exposure for audit
-        previous_exposure = db_risk.business_disruption_net_exposure
-
-        # Update risk fields
-        for field, value in risk_data.dict(exclude_unset=True).items():
-            setattr(db_risk, field, value)
+        # Recalculate net exposure from the submitted ratings
+        values = risk_data.model_dump(exclude_unset=True)
+        net_exposure = net_exposure_for(
+            values["business_disruption_impact_rating"], values["business_disruption_likelihood_rating"]
+        )
 
-        # Recalculate net exposure
-        db_risk.calculate_net_exposure()
-        db_risk.updated_at = datetime.utcnow()  # type: ignore[assignment]
+        # RETURNING hands back the updated row, so no refresh is needed afterwards
+        db_risk = self.db.execute(
+            update(Risk)
+            .where(Risk.risk_id == risk_id)
+            .values(
+                **values,
+                business_disruption_net_exposure=net_exposure,
+            )
+            .returning(Risk)
+        ).scalar_one()
 
         # Create log entry if net exposure changed
         if db_risk.business_disruption_net_exposure != previous_exposure:
@@ -144,19 +469,16 @@ class RiskService:
             )
 
         self.db.commit()
-        self.db.refresh(db_risk)
         return db_risk
 
     @sync_database_after_write
     def delete_risk(self, risk_id: str) -> bool:
         """Delete a risk."""
-        db_risk = self.get_risk(risk_id)
-        if not db_risk:
-            return False
-
-        self.db.delete(db_risk)
+        # Bulk DELETEs instead of an ORM cascade that loads and deletes each log entry in turn
+        self.db.execute(delete(RiskLogEntry).where(RiskLogEntry.risk_id == risk_id))
+        result = self.db.execute(delete(Risk).where(Risk.risk_id == risk_id))
         self.db.commit()
-        return True
+        return bool(result.rowcount)  # type: ignore[attr-defined]
 
     def _generate_risk_id(self) -> str:
         """Generate a unique risk ID in format TR-YYYY-###."""
@@ -164,39 +486,57 @@ class RiskService:
         year = datetime.now().year
 
         # Find next sequence number for this year
-        like_pattern = f"TR-{year}-%"
-        existing_count = self.db.query(Risk).filter(Risk.risk_id.like(like_pattern)).count()
-
-        sequence = existing_count + 1
+        sequence = self._next_sequence(f"risk:{year}", Risk.risk_id, f"TR-{year}-")
 
         return f"TR-{year}-{sequence:03d}"
 
-    def _get_category_abbreviation(self, category: str) -> str:
+    def _next_log_entry_id(self, risk_id: str) -> str:
+        """Generate the next log entry ID for a risk in format LOG-<risk_id>-###."""
+        return self._next_log_entry_ids(risk_id, 1)[0]
+
+    def _next_log_entry_ids(self, risk_id: str, count: int) -> list[str]:
+        """Reserve a block of consecutive log entry IDs for a risk with one counter update."""
+        first = self._next_sequence(f"log:{risk_id}", RiskLogEntry.log_entry_id, f"LOG-{risk_id}-", count)
+        return [f"LOG-{risk_id}-{sequence:03d}" for sequence in range(first, first + count)]
+
+    def _next_sequence(self, name: str, id_column: Any, prefix: str, count: int = 1) -> int:
+        """Allocate the next number(s) from a persistent counter instead of counting existing rows.
+
+        Reserves count consecutive numbers and returns the first. The counter is seeded on first
+        use from the IDs already carrying the prefix, so it continues from what earlier count-based
+        generation handed out.
+        """
+        last = self.db.execute(
+            update(IdCounter)
+            .where(IdCounter.name == name)
+            .values(value=IdCounter.value + count)
+            .returning(IdCounter.value)
+        ).scalar_one_or_none()
+        if last is not None:
+            return int(last) - count + 1
+
+        # A half-open range on the indexed ID column seeks the prefix; SQLite's case-insensitive
+        # LIKE cannot use the index
+        prefix_end = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        existing_ids = [row[0] for row in self.db.query(id_column).filter(id_column >= prefix, id_column < prefix_end)]
+        numeric_suffixes = [int(i[len(prefix) :]) for i in existing_ids if i[len(prefix) :].isdigit()]
+        sequence = max([len(existing_ids), *numeric_suffixes]) + 1
+
+        self.db.add(IdCounter(name=name, value=sequence + count - 1))
+        self.db.flush()
+        return sequence
+
+    @staticmethod
+    def _get_category_abbreviation(category: str) -> str:
         """Get 3-letter abbreviation for risk category."""
-        abbreviations = {
-            "Cybersecurity": "CYB",
-            "Infrastructure": "INF",
-            "Application": "APP",
-            "Data Management": "DAT",
-            "Cloud Services": "CLD",
-            "Vendor/Third Party": "VEN",
-            "Regulatory/Compliance": "REG",
-            "Operational": "OPS",
-        }
-        return abbreviations.get(category, "GEN")
+        return _CATEGORY_ABBREVIATIONS.get(category, "GEN")
 
-    def _get_risk_level(self, rating: int) -> str:
+    @staticmethod
+    def _get_risk_level(rating: int) -> str:
         """Convert risk rating to level."""
-        if 1 <= rating <= 3:
-            return "Low"
-        elif 4 <= rating <= 6:
-            return "Medium"
-        elif 8 <= rating <= 12:
-            return "High"
-        elif 15 <= rating <= 25:
-            return "Critical"
-        else:
-            return "Unknown"
+        if 0 <= rating < len(_RISK_LEVELS):
+            return _RISK_LEVELS[rating]
+        return "Unknown"
 
     def _create_log_entry(
         self,
@@ -218,13 +558,11 @@ class RiskService:
     ) -> None:
         """Create a log entry (internal helper method)."""
         # Generate log entry ID
-        existing_count = self.db.query(RiskLogEntry).filter(RiskLogEntry.risk_id == risk_id).count()
-        log_entry_id = f"LOG-{risk_id}-{existing_count + 1:03d}"
+        log_entry_id = self._next_log_entry_id(risk_id)
 
         log_entry = RiskLogEntry(
             log_entry_id=log_entry_id,
             risk_id=risk_id,
-            entry_date=date.today(),
             entry_type=entry_type,
             entry_summary=entry_summary,
             previous_net_exposure=previous_net_exposure,
@@ -263,11 +601,17 @@ class RiskService:
     def create_risk_log_entry(self, log_entry_data: RiskLogEntryCreate) -> RiskLogEntry:
         """Create a new log entry for a risk."""
         # Generate log entry ID
-        existing_count = self.db.query(RiskLogEntry).filter(RiskLogEntry.risk_id == log_entry_data.risk_id).count()
-        log_entry_id = f"LOG-{log_entry_data.risk_id}-{existing_count + 1:03d}"
-
-        # Get current risk data for context
-        current_risk = self.get_risk(log_entry_data.risk_id)
+        log_entry_id = self._next_log_entry_id(log_entry_data.risk_id)
+
+        # Get current risk data for context, reading only the columns used below
+        current_risk: Any = self.db.execute(
+            select(
+                Risk.business_disruption_net_exposure,
+                Risk.business_disruption_impact_rating,
+                Risk.business_disruption_likelihood_rating,
+                Risk.risk_owner,
+            ).where(Risk.risk_id == log_entry_data.risk_id)
+        ).one_or_none()
         if current_risk:
             # Auto-populate previous values if not provided
             if log_entry_data.previous_net_exposure is None:
@@ -279,14 +623,31 @@ class RiskService:
             if log_entry_data.risk_owner_at_time is None:
                 log_entry_data.risk_owner_at_time = str(current_risk.risk_owner)  # type: ignore[assignment]
 
-        db_log_entry = RiskLogEntry(log_entry_id=log_entry_id, **log_entry_data.dict())
+        db_log_entry = RiskLogEntry(log_entry_id=log_entry_id, **log_entry_data.model_dump())
 
         self.db.add(db_log_entry)
         self.db.commit()
-        self.db.refresh(db_log_entry)
 
         return db_log_entry
 
+    @sync_database_after_write
+    def bulk_create_risk_log_entries(self, log_entries: list[RiskLogEntryCreate]) -> list[str]:
+        """Create many log entries with one multi-row INSERT and a single commit.
+
+        Intended for imports; unlike create_risk_log_entry, previous values are not filled in from
+        the current risk. Returns the generated log entry IDs in input order.
+        """
+        ids_by_risk = {
+            risk_id: iter(self._next_log_entry_ids(risk_id, count))
+            for risk_id, count in Counter(entry.risk_id for entry in log_entries).items()
+        }
+        rows = [{"log_entry_id": next(ids_by_risk[entry.risk_id]), **entry.model_dump()} for entry in log_entries]
+
+        if rows:
+            self.db.execute(insert(RiskLogEntry), rows)
+        self.db.commit()
+        return [row["log_entry_id"] for row in rows]
+
     def get_risk_log_entries(self, risk_id: str) -> list[RiskLogEntry]:
         """Get all log entries for a specific risk, ordered by most recent first."""
         return (
@@ -298,7 +659,7 @@ class RiskService:
 
     def get_risk_log_entry(self, log_entry_id: str) -> RiskLogEntry | None:
         """Get a specific log entry by ID."""
-        return self.db.query(RiskLogEntry).filter(RiskLogEntry.log_entry_id == log_entry_id).first()
+        return self.db.execute(_GET_LOG_ENTRY_STMT, {"log_entry_id": log_entry_id}).scalar_one_or_none()
 
     @sync_database_after_write
     def update_risk_log_entry(self, log_entry_id: str, log_entry_data: RiskLogEntryUpdate) -> RiskLogEntry | None:
@@ -308,30 +669,34 @@ class RiskService:
             return None
 
         # Update only provided fields
-        for field, value in log_entry_data.dict(exclude_unset=True).items():
-            setattr(db_log_entry, field, value)
+        for field in log_entry_data.model_fields_set:
+            setattr(db_log_entry, field, getattr(log_entry_data, field))
 
         self.db.commit()
-        self.db.refresh(db_log_entry)
 
         return db_log_entry
 
     def approve_risk_log_entry(self, log_entry_id: str, reviewed_by: str) -> RiskLogEntry | None:
         """Approve a log entry and update the parent risk's current rating."""
-        db_log_entry = self.get_risk_log_entry(log_entry_id)
+        # The parent risk is always modified below, so load it in the same query
+        db_log_entry = (
+            self.db.query(RiskLogEntry)
+            .options(joinedload(RiskLogEntry.risk))
+            .filter(RiskLogEntry.log_entry_id == log_entry_id)
+            .first()
+        )
         if not db_log_entry:
             return None
 
         # Update approval status
         db_log_entry.entry_status = "Approved"  # type: ignore[assignment]
         db_log_entry.reviewed_by = reviewed_by  # type: ignore[assignment]
-        db_log_entry.approved_date = date.today()  # type: ignore[assignment]
+        db_log_entry.approved_date = func.current_date()  # type: ignore[assignment]
 
         # Apply the rating changes to the parent risk
         db_log_entry.update_parent_risk_rating()
 
         self.db.commit()
-        self.db.refresh(db_log_entry)
 
         return db_log_entry
 
@@ -344,10 +709,9 @@ class RiskService:
         # Update rejection status
         db_log_entry.entry_status = "Rejected"  # type: ignore[assignment]
         db_log_entry.reviewed_by = reviewed_by  # type: ignore[assignment]
-        db_log_entry.approved_date = date.today()  # type: ignore[assignment]  # Date of decision
+        db_log_entry.approved_date = func.current_date()  # type: ignore[assignment]  # Date of decision
 
         self.db.commit()
-        self.db.refresh(db_log_entry)
 
         return db_log_entry
 
@@ -0,0 +1,104 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core.exceptions import DeadlineExceeded, NotModified
+
+from app.services.cloud_storage import CloudStorageService
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    """CloudStorageService configured for a fake bucket with a mocked GCS client."""
+    service = CloudStorageService()
+    service.bucket_name = "test-bucket"
+    service.project_id = "test-project"
+    service.local_db_path = tmp_path / "risk_register.db"
+    service.client = MagicMock()
+    return service
+
+
+def _blob(service):
+    return service.client.bucket.return_value.blob.return_value
+
+
+class TestCloudStorageService:
+    """Test cases for CloudStorageService with a mocked GCS client."""
+
+    def test_sync_skipped_when_not_configured(self):
+        """Test sync is a no-op when no bucket is configured."""
+        service = CloudStorageService()
+        service.bucket_name = ""
+
+        assert service.sync_database_from_cloud() is False
+
+    def test_sync_passes_timeout_to_gcs_requests(self, storage_service):
+        """Test the sync timeout is enforced through the GCS client rather than signals."""
+        blob = _blob(storage_service)
+        blob.exists.return_value = True
+        blob.download_to_filename.side_effect = lambda filename, **kwargs: Path(filename).write_bytes(b"cloud")
+
+        assert storage_service.sync_database_from_cloud(timeout_seconds=5) is True
+
+        blob.exists.assert_called_with(timeout=5)
+        assert blob.download_to_filename.call_args.kwargs["timeout"] == 5
+
+    def test_sync_returns_false_on_deadline_exceeded(self, storage_service):
+        """Test a GCS deadline error is reported as a failed sync."""
+        _blob(storage_service).exists.side_effect = DeadlineExceeded("too slow")
+
+        assert storage_service.sync_database_from_cloud(timeout_seconds=1) is False
+
+    def test_sync_skips_download_when_generation_unchanged(self, storage_service):
+        """Test a recorded generation turns the sync into a conditional download that can return 304."""
+        storage_service.local_db_path.write_bytes(b"local")
+        storage_service._write_local_generation(42)
+        blob = _blob(storage_service)
+        blob.download_to_filename.side_effect = NotModified("unchanged")
+
+        assert storage_service.sync_database_from_cloud() is True
+
+        assert blob.download_to_filename.call_args.kwargs["if_generation_not_match"] == 42
+        blob.reload.assert_not_called()
+        assert storage_service.local_db_path.read_bytes() == b"local"
+
+    def test_sync_downloads_newer_generation(self, storage_service):
+        """Test a changed generation replaces the local database and records the new generation."""
+        storage_service.local_db_path.write_bytes(b"local")
+        storage_service._write_local_generation(42)
+        blob = _blob(storage_service)
+        blob.generation = 43
+        blob.download_to_filename.side_effect = lambda filename, **kwargs: Path(filename).write_bytes(b"cloud")
+
+        assert storage_service.sync_database_from_cloud() is True
+
+        assert storage_service.local_db_path.read_bytes() == b"cloud"
+        assert storage_service._read_local_generation() == 43
+
+    def test_download_database_replaces_file_atomically(self, storage_service):
+        """Test downloads go to a temporary file and leave the local database intact on failure."""
+        storage_service.local_db_path.write_bytes(b"local")
+        blob = _blob(storage_service)
+        blob.download_to_filename.side_effect = DeadlineExceeded("too slow")
+
+        assert storage_service.download_database() is False
+
+        downloaded_to = blob.download_to_filename.call_args.args[0]
+        assert downloaded_to.endswith(".db.tmp")
+        assert blob.download_to_filename.call_args.kwargs["checksum"] == "crc32c"
+        assert storage_service.local_db_path.read_bytes() == b"local"
+        assert not storage_service.local_db_path.with_suffix(".db.tmp").exists()
+
+    def test_bucket_handle_reused_until_bucket_name_changes(self, storage_service):
+        """Test the Bucket handle is built once and rebuilt when the bucket name changes."""
+        first = MagicMock()
+        first.name = "test-bucket"
+        second = MagicMock()
+        second.name = "other-bucket"
+        storage_service.client.bucket.side_effect = [first, second]
+
+        assert storage_service._get_bucket() is first
+        assert storage_service._get_bucket() is first
+        storage_service.bucket_name = "other-bucket"
+        assert storage_service._get_bucket() is second
+        assert storage_service.client.bucket.call_count == 2
@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+from sqlalchemy import event
+
 from app.schemas.dashboard import (
     BusinessServiceExposure,
     ControlPosture,
@@ -42,6 +44,54 @@ class TestDashboardService:
         assert isinstance(data.technology_domain_risks, list)
         assert isinstance(data.control_posture, ControlPosture)
 
+    def test_get_dashboard_data_reuses_aggregates(self, db_session, dashboard_sample_risks):
+        """Test get_dashboard_data computes the active-risk total once instead of per metric."""
+        service = DashboardService(db_session)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            data = service.get_dashboard_data()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert data.total_active_risks == 4
+        # Fingerprint probe, one aggregate, one domain query, one top-risks query and one activity query
+        assert len(statements) <= 5
+        assert sum("count(*) AS total" in statement for statement in statements) == 1
+
+    def test_get_dashboard_data_cached_until_data_changes(self, db_session, dashboard_sample_risks):
+        """Test get_dashboard_data reuses the cached result until a risk is modified."""
+        service = DashboardService(db_session)
+        first = service.get_dashboard_data()
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            second = service.get_dashboard_data()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # Only the fingerprint probe runs on a cache hit
+        assert second is first
+        assert len(statements) == 1
+
+        db_session.delete(dashboard_sample_risks[3])
+        db_session.commit()
+
+        third = service.get_dashboard_data()
+        assert third is not first
+        assert third.total_active_risks == first.total_active_risks - 1
+
     def test_get_active_risks_query(self, db_session, dashboard_sample_risks):
         """Test _get_active_risks_query filters correctly."""
         service = DashboardService(db_session)
@@ -126,6 +176,18 @@ class TestDashboardService:
             assert domain_risk.risk_count >= 0
             assert domain_risk.average_risk_rating >= 0.0
 
+    def test_get_technology_domain_risks_scores(self, db_session, dashboard_sample_risks):
+        """Test per-domain averages use the numeric net exposure score of active risks only."""
+        service = DashboardService(db_session)
+        active_risks = service._get_active_risks_query()
+        domain_risks = {d.domain: d for d in service._get_technology_domain_risks(active_risks)}
+
+        assert set(domain_risks) == {"Security", "Infrastructure", "Applications", "Business Process"}
+        assert domain_risks["Security"].risk_count == 1
+        assert domain_risks["Security"].average_risk_rating == 16.0
+        assert domain_risks["Infrastructure"].average_risk_rating == 11.0
+        assert domain_risks["Business Process"].average_risk_rating == 2.0
+
     def test_get_control_posture_empty(self, db_session):
         """Test _get_control_posture with empty database."""
         service = DashboardService(db_session)
@@ -180,6 +242,16 @@ class TestDashboardService:
             assert isinstance(risk.risk_title, str)
             assert isinstance(risk.business_disruption_net_exposure, str)
 
+    def test_get_top_priority_risks_ordered_by_exposure_score(self, db_session, dashboard_sample_risks):
+        """Test top risks are ranked by the numeric net exposure score rather than the exposure label."""
+        service = DashboardService(db_session)
+        active_risks = service._get_active_risks_query()
+        top_risks = service._get_top_priority_risks(active_risks)
+
+        assert top_risks[0].risk_id == "TR-2024-CYB-001"
+        assert top_risks[0].business_disruption_net_exposure == "Critical (16)"
+        assert top_risks[1].business_disruption_net_exposure == "High (11)"
+
     def test_get_risk_response_breakdown_empty(self, db_session):
         """Test _get_risk_response_breakdown with empty database."""
         service = DashboardService(db_session)
@@ -239,6 +311,7 @@ class TestDashboardService:
 
         assert isinstance(avg_impact, Decimal)
         assert avg_impact >= Decimal("0.00")
+        assert avg_impact == Decimal("713750.00")
 
     def test_get_high_financial_impact_risks(self, db_session, dashboard_sample_risks):
         """Test _get_high_financial_impact_risks."""
@@ -282,3 +355,56 @@ class TestDashboardService:
         assert exposure.total_ibs_affected >= 0
         assert 0.0 <= exposure.percentage_risks_with_ibs_impact <= 100.0
         assert exposure.critical_risks_affecting_ibs >= 0
+
+    def test_get_risk_management_activity_single_round_trip(self, db_session, dashboard_sample_risks):
+        """Test the review and log entry activity counts come back from one statement."""
+        service = DashboardService(db_session)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            activity = service._get_risk_management_activity()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert activity.overdue_reviews == 1
+        # Sample log entries are "Risk Assessment Change", not "Risk Assessment Update"
+        assert activity.recent_risk_rating_changes == 0
+
+    def test_get_dashboard_data_skips_list_queries_without_active_risks(self, db_session):
+        """Test an empty register only runs the aggregate and activity queries."""
+        service = DashboardService(db_session)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            data = service._build_dashboard_data()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert data.total_active_risks == 0
+        assert data.technology_domain_risks == []
+        assert data.top_priority_risks == []
+        assert len(statements) == 2
+
+    def test_get_business_service_exposure_excludes_null_ibs(self, db_session, dashboard_sample_risks):
+        """Test that risks with NULL ibs_affected are not counted as affecting IBS."""
+        service = DashboardService(db_session)
+        active_risks = service._get_active_risks_query()
+        exposure = service._get_business_service_exposure(active_risks)
+
+        # Two of the four active risks have IBS populated, one of which is Critical
+        assert exposure.risks_affecting_ibs == 2
+        # "IBS-001, ..., IBS-005" and "IBS-006, IBS-007, IBS-008"
+        assert exposure.total_ibs_affected == 8
+        assert exposure.percentage_risks_with_ibs_impact == 50.0
+        assert exposure.critical_risks_affecting_ibs == 1
@@ -111,6 +111,16 @@ def test_get_dropdown_values_by_category_specific(client, sample_dropdown_values
             assert value["is_active"] is True
 
 
+def test_get_dropdown_values_by_category_comma_separated(client, sample_dropdown_values):
+    """Test GET /dropdown/values/by-category with a comma-separated category list."""
+    response = client.get("/api/v1/dropdown/values/by-category?categories=risk_status,risk_category")
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert set(data.keys()) == {"risk_status", "risk_category"}
+
+
 def test_get_dropdown_values_by_category_nonexistent(client, sample_dropdown_values):
     """Test GET /dropdown/values/by-category with nonexistent categories."""
     response = client.get("/api/v1/dropdown/values/by-category?categories=nonexistent")
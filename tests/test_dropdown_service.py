@@ -1,3 +1,5 @@
+from sqlalchemy import event
+
 from app.models.risk import DropdownValue
 from app.services.dropdown_service import DropdownService
 
@@ -126,3 +128,28 @@ class TestDropdownService:
         result = service.get_dropdown_values_by_categories(categories=["test_category"])
         assert len(result["test_category"]) == 1
         assert result["test_category"][0].value == "Active Value"
+
+    def test_values_cached_until_dropdown_values_change(self, db_session, sample_dropdown_values):
+        """Test repeated reads are served from the cache and a committed write invalidates it."""
+        service = DropdownService(db_session)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            service.get_dropdown_values(category="risk_status")
+            service.get_dropdown_categories()
+            service.get_dropdown_values_by_categories()
+            assert len(statements) == 1
+
+            db_session.add(DropdownValue(category="risk_status", value="Escalated", display_order=99))
+            db_session.commit()
+
+            values = service.get_dropdown_values(category="risk_status")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert values[-1].value == "Escalated"
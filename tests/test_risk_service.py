@@ -1,8 +1,11 @@
-from datetime import date, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import patch
 
+import pytest
+from sqlalchemy import event, text, update
+
 from app.models.risk import Risk, RiskLogEntry
-from app.schemas.risk import RiskCreate, RiskUpdate
+from app.schemas.risk import RiskCreate, RiskLogEntryCreate, RiskLogEntryUpdate, RiskUpdate
 from app.services.risk_service import RiskService
 
 
@@ -39,6 +42,17 @@ class TestRiskService:
         risks = service.get_risks(skip=1, limit=1)
         assert len(risks) == 1
 
+    def test_get_risks_deep_page_matches_offset_order(self, db_session, sample_risks):
+        """Test the deferred-join path for skip > 0 returns the same rows as slicing the full listing."""
+        service = RiskService(db_session)
+        all_ids = [risk.risk_id for risk in service.get_risks()]
+
+        assert [risk.risk_id for risk in service.get_risks(skip=1, limit=1)] == all_ids[1:2]
+        risks, total = service.get_risks_page(skip=1, limit=5, sort_by="risk_title", sort_order="desc")
+        titles = [risk.risk_title for risk in service.get_risks(sort_by="risk_title", sort_order="desc")]
+        assert [risk.risk_title for risk in risks] == titles[1:]
+        assert total == 2
+
     def test_get_risks_with_search_title(self, db_session, sample_risks):
         """Test get_risks with search in title."""
         service = RiskService(db_session)
@@ -60,6 +74,25 @@ class TestRiskService:
         assert len(risks) == 1
         assert "Cybersecurity" in risks[0].risk_title
 
+    def test_get_risks_search_index_follows_updates(self, db_session, sample_risks):
+        """Test the full-text search index tracks title changes and deletes."""
+        service = RiskService(db_session)
+        risk = service.get_risk("TR-2024-CYB-001")
+        risk.risk_title = "Ransomware Outbreak"
+        db_session.commit()
+
+        assert [risk.risk_id for risk in service.get_risks(search="ransomware")] == ["TR-2024-CYB-001"]
+
+        service.delete_risk("TR-2024-CYB-001")
+        assert service.get_risks(search="ransomware") == []
+        assert service.get_risks_count(search="ransomware") == 0
+
+    def test_get_risks_with_short_search(self, db_session, sample_risks):
+        """Test search terms shorter than a trigram still match by substring."""
+        service = RiskService(db_session)
+        risks = service.get_risks(search="Cy")
+        assert [risk.risk_id for risk in risks] == ["TR-2024-CYB-001"]
+
     def test_get_risks_with_search_no_results(self, db_session, sample_risks):
         """Test get_risks with search that returns no results."""
         service = RiskService(db_session)
@@ -191,6 +224,19 @@ class TestRiskService:
         count = service.get_risks_count()
         assert count == 2
 
+    def test_get_risks_count_estimate(self, db_session, sample_risks):
+        """Test get_risks_count_estimate reads sqlite_stat1 and falls back to the exact count."""
+        service = RiskService(db_session)
+        db_session.execute(text("DROP TABLE IF EXISTS sqlite_stat1"))
+        assert service.get_risks_count_estimate() == 2
+
+        db_session.execute(text("ANALYZE"))
+        db_session.execute(text("UPDATE sqlite_stat1 SET stat = '40 1' WHERE tbl = 'risks'"))
+        try:
+            assert service.get_risks_count_estimate() == 40
+        finally:
+            db_session.execute(text("DROP TABLE sqlite_stat1"))
+
     def test_get_risks_count_with_category_filter(self, db_session, sample_risks):
         """Test get_risks_count with category filter."""
         service = RiskService(db_session)
@@ -285,6 +331,69 @@ class TestRiskService:
         count = service.get_risks_count(search="nonexistent search term")
         assert count == 0
 
+    def test_get_risks_page_returns_rows_and_total(self, db_session, sample_risks):
+        """Test get_risks_page returns the requested page with the total across all pages."""
+        service = RiskService(db_session)
+        risks, total = service.get_risks_page(skip=0, limit=1)
+        assert len(risks) == 1
+        assert total == 2
+
+        risks, total = service.get_risks_page(category="Cybersecurity")
+        assert [risk.risk_id for risk in risks] == ["TR-2024-CYB-001"]
+        assert total == 1
+
+    def test_get_risks_page_cached_until_write(self, db_session, sample_risks):
+        """Test a repeated page is served from the cache and a committed write invalidates it."""
+        service = RiskService(db_session)
+        first = service.get_risks_page(category="Cybersecurity")
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            risks, total = service.get_risks_page(category="Cybersecurity")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # Only the page rows are read back, by primary key
+        assert len(statements) == 1
+        assert ([risk.risk_id for risk in risks], total) == ([risk.risk_id for risk in first[0]], first[1])
+
+        db_session.execute(update(Risk).where(Risk.risk_id == "TR-2024-CYB-001").values(risk_category="Operational"))
+        db_session.commit()
+        assert service.get_risks_page(category="Cybersecurity") == ([], 0)
+
+    def test_get_risks_page_past_end(self, db_session, sample_risks):
+        """Test get_risks_page still reports the total when the page is beyond the last row."""
+        service = RiskService(db_session)
+        risks, total = service.get_risks_page(skip=10, limit=5)
+        assert risks == []
+        assert total == 2
+
+    def test_get_risks_after_walks_default_order(self, db_session, sample_risks):
+        """Test keyset pagination returns the same sequence as the default listing."""
+        service = RiskService(db_session)
+        expected = [risk.risk_id for risk in service.get_risks()]
+
+        first, cursor = service.get_risks_after(limit=1)
+        assert cursor is not None
+        second, cursor = service.get_risks_after(cursor=cursor, limit=1)
+        last, cursor = service.get_risks_after(cursor=cursor, limit=1)
+
+        assert [risk.risk_id for risk in first + second] == expected
+        assert last == []
+        assert cursor is None
+
+    def test_get_risks_after_invalid_cursor(self, db_session):
+        """Test a malformed cursor is rejected."""
+        service = RiskService(db_session)
+        with pytest.raises(ValueError):
+            service.get_risks_after(cursor="not-a-cursor")
+
     def test_get_risk_exists(self, db_session, sample_risks):
         """Test get_risk with existing risk."""
         service = RiskService(db_session)
@@ -343,6 +452,179 @@ class TestRiskService:
         assert log_entry is not None
         assert log_entry.entry_type == "Risk Creation"
 
+    def test_create_risk_single_commit(self, db_session):
+        """Test the risk and its initial log entry are written in one transaction."""
+        service = RiskService(db_session)
+        risk_data = RiskCreate(
+            risk_title="Test Risk",
+            risk_description="Test Description",
+            risk_category="Cybersecurity",
+            risk_owner="Test User",
+            risk_status="Open",
+            risk_response_strategy="Mitigate",
+            preventative_controls_coverage="Adequate",
+            preventative_controls_effectiveness="Effective",
+            detective_controls_coverage="Adequate",
+            detective_controls_effectiveness="Effective",
+            corrective_controls_coverage="Adequate",
+            corrective_controls_effectiveness="Effective",
+            risk_owner_department="IT",
+            technology_domain="Security",
+            business_disruption_impact_rating="Moderate",
+            business_disruption_impact_description="Moderate impact to operations",
+            business_disruption_likelihood_rating="Unlikely",
+            business_disruption_likelihood_description="Unlikely to occur",
+            date_identified=date.today(),
+            last_reviewed=date.today(),
+            next_review_date=date.today(),
+        )
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            risk = service.create_risk(risk_data)
+
+        assert commit.call_count == 1
+        assert risk.created_at is not None
+        assert db_session.query(RiskLogEntry).filter(RiskLogEntry.risk_id == risk.risk_id).count() == 1
+
+    @patch("app.services.risk_service.datetime")
+    def test_bulk_create_risks(self, mock_datetime, db_session, sample_risks):
+        """Test bulk_create_risks creates every risk and its creation log entry in one commit."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15)
+
+        service = RiskService(db_session)
+        base = {
+            "risk_description": "Test Description",
+            "risk_category": "Cybersecurity",
+            "risk_owner": "Test User",
+            "risk_status": "Open",
+            "risk_response_strategy": "Mitigate",
+            "preventative_controls_coverage": "Adequate",
+            "preventative_controls_effectiveness": "Effective",
+            "detective_controls_coverage": "Adequate",
+            "detective_controls_effectiveness": "Effective",
+            "corrective_controls_coverage": "Adequate",
+            "corrective_controls_effectiveness": "Effective",
+            "risk_owner_department": "IT",
+            "technology_domain": "Security",
+            "business_disruption_impact_rating": "Moderate",
+            "business_disruption_impact_description": "Moderate impact to operations",
+            "business_disruption_likelihood_rating": "Unlikely",
+            "business_disruption_likelihood_description": "Unlikely to occur",
+            "date_identified": date.today(),
+            "last_reviewed": date.today(),
+            "next_review_date": date.today(),
+        }
+        risks_data = [
+            RiskCreate(risk_title="Generated A", **base),
+            RiskCreate(risk_id="TR-2024-100", risk_title="Explicit", **base),
+            RiskCreate(risk_title="Generated B", **base),
+        ]
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            risks = service.bulk_create_risks(risks_data)
+
+        assert commit.call_count == 1
+        # sample_risks already holds TR-2024-001 and -002
+        assert [risk.risk_id for risk in risks] == ["TR-2024-003", "TR-2024-100", "TR-2024-004"]
+        assert all(risk.business_disruption_net_exposure is not None for risk in risks)
+        assert db_session.query(RiskLogEntry).filter(RiskLogEntry.entry_type == "Risk Creation").count() == 3
+        assert service.get_existing_risk_ids(["TR-2024-100", "TR-2024-999"]) == {"TR-2024-100"}
+
+    def test_create_risk_log_entry_populates_previous_values(self, db_session, sample_risks):
+        """Test create_risk_log_entry fills unset previous values from the current risk."""
+        service = RiskService(db_session)
+        risk = service.get_risk("TR-2024-CYB-001")
+
+        log_entry = service.create_risk_log_entry(
+            RiskLogEntryCreate(
+                risk_id="TR-2024-CYB-001",
+                entry_date=date.today(),
+                entry_type="Risk Assessment Update",
+                entry_summary="Reassessed after control review",
+                created_by="Test User",
+            )
+        )
+
+        assert log_entry.previous_net_exposure == risk.business_disruption_net_exposure
+        assert log_entry.previous_impact_rating == risk.business_disruption_impact_rating
+        assert log_entry.previous_likelihood_rating == risk.business_disruption_likelihood_rating
+        assert log_entry.risk_owner_at_time == risk.risk_owner
+
+    def test_bulk_create_risk_log_entries(self, db_session, sample_risks):
+        """Test bulk-created log entries get consecutive per-risk IDs and are committed once."""
+        service = RiskService(db_session)
+        service.create_risk_log_entry(
+            RiskLogEntryCreate(
+                risk_id="TR-2024-CYB-001",
+                entry_date=date.today(),
+                entry_type="Review",
+                entry_summary="Existing entry",
+                created_by="Test User",
+            )
+        )
+
+        entries = [
+            RiskLogEntryCreate(
+                risk_id=risk_id,
+                entry_date=date.today(),
+                entry_type="Review",
+                entry_summary=f"Imported entry {i}",
+                created_by="Importer",
+            )
+            for i, risk_id in enumerate(["TR-2024-CYB-001", "TR-2024-INF-001", "TR-2024-CYB-001"])
+        ]
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            log_entry_ids = service.bulk_create_risk_log_entries(entries)
+
+        assert commit.call_count == 1
+        assert log_entry_ids == [
+            "LOG-TR-2024-CYB-001-002",
+            "LOG-TR-2024-INF-001-001",
+            "LOG-TR-2024-CYB-001-003",
+        ]
+        assert service.get_risk_log_entry("LOG-TR-2024-CYB-001-003").entry_summary == "Imported entry 2"
+
+    def test_update_risk_log_entry_only_set_fields(self, db_session, dashboard_sample_risks):
+        """Test update_risk_log_entry assigns only the fields present in the update."""
+        service = RiskService(db_session)
+        original = service.get_risk_log_entry("LOG-TR-2024-CYB-001-01")
+        original_type = original.entry_type
+
+        updated = service.update_risk_log_entry(
+            "LOG-TR-2024-CYB-001-01", RiskLogEntryUpdate(entry_summary="Revised summary", reviewed_by=None)
+        )
+
+        assert updated.entry_summary == "Revised summary"
+        assert updated.reviewed_by is None
+        assert updated.entry_type == original_type
+
+    def test_log_entry_defaults_returned_on_flush(self, db_session, sample_risks):
+        """Test server defaults are populated by the INSERT itself, without a follow-up SELECT."""
+        log_entry = RiskLogEntry(
+            log_entry_id="LOG-TR-2024-CYB-001-900",
+            risk_id="TR-2024-CYB-001",
+            entry_type="Review",
+            entry_summary="Quarterly review",
+            created_by="Test User",
+        )
+        db_session.add(log_entry)
+        db_session.flush()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            assert log_entry.entry_date == datetime.now(UTC).date()
+            assert log_entry.created_at is not None
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert statements == []
+
     def test_update_risk_exists(self, db_session, sample_risks):
         """Test update_risk with existing risk."""
         service = RiskService(db_session)
@@ -379,6 +661,19 @@ class TestRiskService:
         assert risk.risk_title == "Updated Title"
         assert risk.business_disruption_impact_rating == "Catastrophic"
         assert risk.business_disruption_likelihood_rating == "Probable"
+        assert risk.business_disruption_net_exposure == "Critical (16)"
+
+        # The exposure change is audited against the value held before the update
+        log_entry = (
+            db_session.query(RiskLogEntry)
+            .filter(RiskLogEntry.risk_id == risk.risk_id, RiskLogEntry.entry_type == "Risk Assessment Update")
+            .one()
+        )
+        assert log_entry.new_net_exposure == "Critical (16)"
+        assert log_entry.previous_net_exposure != log_entry.new_net_exposure
+        # Both timestamps are stamped without the service setting them
+        assert log_entry.entry_date == datetime.now(UTC).date()
+        assert risk.updated_at is not None
 
     def test_update_risk_not_exists(self, db_session):
         """Test update_risk with non-existing risk."""
@@ -421,6 +716,16 @@ class TestRiskService:
         risk = service.get_risk("TR-2024-CYB-001")
         assert risk is None
 
+    def test_delete_risk_removes_log_entries(self, db_session, dashboard_sample_risks):
+        """Test delete_risk also removes the risk's log entries."""
+        service = RiskService(db_session)
+        assert db_session.query(RiskLogEntry).filter(RiskLogEntry.risk_id == "TR-2024-CYB-001").count() > 0
+
+        assert service.delete_risk("TR-2024-CYB-001") is True
+
+        assert db_session.query(RiskLogEntry).filter(RiskLogEntry.risk_id == "TR-2024-CYB-001").count() == 0
+        assert service.get_risk("TR-2024-CYB-001") is None
+
     def test_delete_risk_not_exists(self, db_session):
         """Test delete_risk with non-existing risk."""
         service = RiskService(db_session)
@@ -446,6 +751,51 @@ class TestRiskService:
         # Should be 003 since sample_risks creates 2 risks
         assert risk_id == "TR-2024-003"
 
+    @patch("app.services.risk_service.datetime")
+    def test_generate_risk_id_does_not_reuse_after_delete(self, mock_datetime, db_session, sample_risks):
+        """Test the persistent counter keeps allocating forward after a risk is deleted."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15)
+
+        service = RiskService(db_session)
+        assert service._generate_risk_id() == "TR-2024-003"
+        service.delete_risk("TR-2024-CYB-001")
+        assert service._generate_risk_id() == "TR-2024-004"
+
+    def test_approve_risk_log_entry_loads_parent_risk_with_entry(self, db_session, sample_risks):
+        """Test approving a log entry applies its ratings and fetches the parent risk in the same query."""
+        db_session.add(
+            RiskLogEntry(
+                log_entry_id="LOG-TR-2024-INF-001-001",
+                risk_id="TR-2024-INF-001",
+                entry_date=date.today(),
+                entry_type="Risk Assessment Update",
+                entry_summary="Likelihood increased",
+                new_impact_rating="Catastrophic",
+                new_likelihood_rating="Probable",
+                created_by="Test User",
+            )
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        service = RiskService(db_session)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            log_entry = service.approve_risk_log_entry("LOG-TR-2024-INF-001-001", reviewed_by="Reviewer")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert log_entry.entry_status == "Approved"
+        assert service.get_risk("TR-2024-INF-001").business_disruption_net_exposure == "Critical (16)"
+        assert "JOIN risks" in statements[0]
+        assert statements[1].startswith("UPDATE")
+
     def test_get_category_abbreviation_known(self, db_session):
         """Test _get_category_abbreviation with known categories."""
         service = RiskService(db_session)